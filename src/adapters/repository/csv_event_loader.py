@@ -1,7 +1,7 @@
 """
 CSV 이벤트 로더 구현체
 
-EventLoaderPort 인터페이스를 구현하여 CSV 파일에서 이벤트 데이터를 로드합니다.
+CachedEventLoader를 상속하여 CSV 파일에서 이벤트 데이터를 로드합니다.
 """
 
 import csv
@@ -9,18 +9,13 @@ import os
 from typing import List, Dict
 from pathlib import Path
 
-from core.domain.event_loader import EventLoaderPort
+from core.domain.event_loader import CachedEventLoader
 from core.domain.event import EventTemplate
 
 
-class CSVEventLoader(EventLoaderPort):
+class CSVEventLoader(CachedEventLoader):
     """CSV 파일에서 이벤트를 로드하는 구현체"""
     
-    def __init__(self):
-        """CSV 이벤트 로더 초기화"""
-        self._event_cache: Dict[str, EventTemplate] = {}
-        self._csv_loaded = False
-    
     def load_event_templates(self, csv_file_path: str) -> List[EventTemplate]:
         """CSV 파일에서 이벤트 템플릿들을 로드합니다."""
         if not os.path.exists(csv_file_path):
@@ -41,9 +36,6 @@ class CSVEventLoader(EventLoaderPort):
                         template = self._parse_csv_row(row, row_num)
                         event_templates.append(template)
                         
-                        # 캐시에 저장
-                        self._event_cache[template.csv_id] = template
-                        
                     except Exception as e:
                         raise ValueError(f"CSV {row_num}행 파싱 오류: {e}")
                         
@@ -52,19 +44,10 @@ class CSVEventLoader(EventLoaderPort):
         except Exception as e:
             raise ValueError(f"CSV 파일 읽기 오류: {e}")
         
-        self._csv_loaded = True
+        # 캐시에 저장 (이후 ID 조회는 색인에서 처리)
+        self._cache_templates(event_templates)
         return event_templates
     
-    def get_event_template_by_id(self, csv_id: str) -> EventTemplate:
-        """CSV ID로 특정 이벤트 템플릿을 조회합니다."""
-        if not self._csv_loaded:
-            raise ValueError("먼저 load_event_templates()를 호출하여 CSV를 로드해야 합니다")
-        
-        if csv_id not in self._event_cache:
-            raise ValueError(f"해당 ID의 이벤트를 찾을 수 없습니다: {csv_id}")
-        
-        return self._event_cache[csv_id]
-    
     def validate_csv_format(self, csv_file_path: str) -> bool:
         """CSV 파일 형식이 올바른지 검증합니다."""
         required_columns = {
@@ -121,17 +104,3 @@ class CSVEventLoader(EventLoaderPort):
             
         except Exception as e:
             raise ValueError(f"행 파싱 오류: {e}")
-    
-
-    def get_loaded_event_count(self) -> int:
-        """로드된 이벤트 개수를 반환"""
-        return len(self._event_cache)
-    
-    def clear_cache(self):
-        """캐시를 초기화"""
-        self._event_cache.clear()
-        self._csv_loaded = False
-    
-    def get_all_event_ids(self) -> List[str]:
-        """로드된 모든 이벤트 ID 목록을 반환"""
-        return list(self._event_cache.keys()) 
\ No newline at end of file
@@ -150,6 +150,122 @@ class ActionService:
         RestAction.SLEEP: {"stamina": 8},
     }
     
+    # 행동별 자금 소모량 (기본적으로 대부분의 행동은 무료)
+    ACTION_MONEY_COSTS = {
+        AdvertisingAction.FLYER: 50000,  # 전단지 5만원
+        AdvertisingAction.ONLINE_AD: 100000,  # 온라인광고 10만원
+        AdvertisingAction.DELIVERY_APP: 30000,  # 배달앱 3만원
+        OperationAction.ORDER_INGREDIENTS: 200000,  # 재료주문 20만원
+        OperationAction.HIRE_PARTTIME: 80000,  # 알바고용 8만원
+        PersonalAction.VACATION: 150000,  # 휴가 15만원
+    }
+    
+    # 광고 행동별 인지도 증가량
+    ADVERTISING_AWARENESS_GAINS = {
+        AdvertisingAction.FLYER: 5.0,
+        AdvertisingAction.ONLINE_AD: 8.0,
+        AdvertisingAction.DELIVERY_APP: 12.0,
+    }
+    
+    # 행동 결과 메시지
+    ACTION_RESULT_MESSAGES = {
+        # 조리
+        CookingAction.PREPARE_INGREDIENTS: "재료를 준비했습니다",
+        CookingAction.COOK: "요리를 했습니다",
+        CookingAction.INSPECT_INGREDIENTS: "재료를 점검했습니다",
+        
+        # 광고
+        AdvertisingAction.FLYER: "전단지를 배포했습니다",
+        AdvertisingAction.ONLINE_AD: "온라인 광고를 집행했습니다",
+        AdvertisingAction.DELIVERY_APP: "배달앱에 등록했습니다",
+        
+        # 운영
+        OperationAction.ORDER_INGREDIENTS: "재료를 주문했습니다",
+        OperationAction.CLEAN: "매장을 청소했습니다",
+        OperationAction.EQUIPMENT_CHECK: "장비를 점검했습니다",
+        OperationAction.HIRE_PARTTIME: "아르바이트생을 고용했습니다",
+        
+        # 연구
+        ResearchAction.RECIPE: "레시피를 연구했습니다",
+        ResearchAction.MANAGEMENT: "경영을 연구했습니다",
+        ResearchAction.ADVERTISING_RESEARCH: "광고를 연구했습니다",
+        ResearchAction.SERVICE: "서비스를 연구했습니다",
+        
+        # 개인
+        PersonalAction.VACATION: "휴가를 보냈습니다",
+        PersonalAction.STUDY: "공부를 했습니다",
+        PersonalAction.EXERCISE: "운동을 했습니다",
+        
+        # 휴식
+        RestAction.SLEEP: "잠을 잤습니다",
+    }
+    
+    # 행동 표시 이름
+    ACTION_DISPLAY_NAMES = {
+        # 조리
+        CookingAction.PREPARE_INGREDIENTS: "재료 준비",
+        CookingAction.COOK: "조리",
+        CookingAction.INSPECT_INGREDIENTS: "재료 점검",
+        
+        # 광고
+        AdvertisingAction.FLYER: "전단지 배포",
+        AdvertisingAction.ONLINE_AD: "온라인 광고",
+        AdvertisingAction.DELIVERY_APP: "배달앱 등록",
+        
+        # 운영
+        OperationAction.ORDER_INGREDIENTS: "재료 주문",
+        OperationAction.CLEAN: "매장 청소",
+        OperationAction.EQUIPMENT_CHECK: "장비 점검",
+        OperationAction.HIRE_PARTTIME: "아르바이트생 고용",
+        
+        # 연구
+        ResearchAction.RECIPE: "레시피 연구",
+        ResearchAction.MANAGEMENT: "경영 연구",
+        ResearchAction.ADVERTISING_RESEARCH: "광고 연구",
+        ResearchAction.SERVICE: "서비스 연구",
+        
+        # 개인
+        PersonalAction.VACATION: "휴가",
+        PersonalAction.STUDY: "학습",
+        PersonalAction.EXERCISE: "운동",
+        
+        # 휴식
+        RestAction.SLEEP: "수면",
+    }
+    
+    # 행동 설명
+    ACTION_DESCRIPTIONS = {
+        # 조리
+        CookingAction.PREPARE_INGREDIENTS: "요리에 필요한 재료를 준비합니다. 요리 스킬이 향상됩니다.",
+        CookingAction.COOK: "실제로 요리를 합니다. 요리 스킬이 크게 향상됩니다.",
+        CookingAction.INSPECT_INGREDIENTS: "재료의 상태를 확인합니다. 요리와 경영 스킬이 향상됩니다.",
+        
+        # 광고
+        AdvertisingAction.FLYER: "전단지를 제작하고 배포합니다. 매장 인지도가 증가합니다.",
+        AdvertisingAction.ONLINE_AD: "온라인 광고를 집행합니다. 매장 인지도가 크게 증가합니다.",
+        AdvertisingAction.DELIVERY_APP: "배달앱에 매장을 등록합니다. 매장 인지도와 배달 주문이 증가합니다.",
+        
+        # 운영
+        OperationAction.ORDER_INGREDIENTS: "필요한 재료를 주문합니다. 경영 스킬이 향상됩니다.",
+        OperationAction.CLEAN: "매장을 깨끗하게 청소합니다. 서비스 스킬이 향상됩니다.",
+        OperationAction.EQUIPMENT_CHECK: "장비 상태를 점검하고 정비합니다. 기술과 경영 스킬이 향상됩니다.",
+        OperationAction.HIRE_PARTTIME: "아르바이트생을 고용합니다. 경영과 서비스 스킬이 향상됩니다.",
+        
+        # 연구
+        ResearchAction.RECIPE: "새로운 레시피를 연구합니다. 요리 스킬이 크게 향상됩니다.",
+        ResearchAction.MANAGEMENT: "경영 기법을 연구합니다. 경영 스킬이 크게 향상됩니다.",
+        ResearchAction.ADVERTISING_RESEARCH: "광고 전략을 연구합니다. 경영과 기술 스킬이 향상됩니다.",
+        ResearchAction.SERVICE: "서비스 방법을 연구합니다. 서비스 스킬이 크게 향상됩니다.",
+        
+        # 개인
+        PersonalAction.VACATION: "휴가를 보내며 휴식합니다. 피로도가 크게 감소하고 체력이 향상됩니다.",
+        PersonalAction.STUDY: "새로운 지식을 학습합니다. 기술과 경영 스킬이 향상됩니다.",
+        PersonalAction.EXERCISE: "운동을 하여 체력을 기릅니다. 체력이 크게 향상됩니다.",
+        
+        # 휴식
+        RestAction.SLEEP: "잠을 자며 피로를 회복합니다. 피로도가 감소하고 체력이 향상됩니다.",
+    }
+    
     def __init__(self, repository: RepositoryPort):
         self._repository = repository
     
@@ -240,7 +356,7 @@ class ActionService:
         # 4. 자금 확인 (필요한 경우)
         required_money = self._get_action_cost(specific_action, player)
         if required_money > 0 and player.money.amount < required_money:
-            return False, f"자금이 부족합니다. 필요: {Money(required_money).format_korean()}"
+            return False, f"자금이 부족합니다. 필요: {Money.of(required_money).format_korean()}"
         
         return True, "유효한 행동입니다."
     
@@ -268,7 +384,7 @@ class ActionService:
         
         # 2. 자금 차감
         if action_cost > 0:
-            updated_player = updated_player.spend_money(Money(action_cost))
+            updated_player = updated_player.spend_money(Money.of(action_cost))
         
         # 3. 경험치 적용
         for stat_name, exp_amount in total_exp_gains.items():
@@ -320,17 +436,7 @@ class ActionService:
     
     def _get_action_cost(self, specific_action, player: Player) -> int:
         """행동별 자금 소모량 계산"""
-        # 기본적으로 대부분의 행동은 무료
-        action_costs = {
-            AdvertisingAction.FLYER: 50000,  # 전단지 5만원
-            AdvertisingAction.ONLINE_AD: 100000,  # 온라인광고 10만원
-            AdvertisingAction.DELIVERY_APP: 30000,  # 배달앱 3만원
-            OperationAction.ORDER_INGREDIENTS: 200000,  # 재료주문 20만원
-            OperationAction.HIRE_PARTTIME: 80000,  # 알바고용 8만원
-            PersonalAction.VACATION: 150000,  # 휴가 15만원
-        }
-        
-        return action_costs.get(specific_action, 0)
+        return self.ACTION_MONEY_COSTS.get(specific_action, 0)
     
     def _apply_special_effects(self, player: Player, specific_action, request: ActionRequest) -> Tuple[Player, str]:
         """행동별 특수 효과 적용"""
@@ -397,49 +503,11 @@ class ActionService:
     
     def _calculate_awareness_increase(self, advertising_action: AdvertisingAction) -> float:
         """광고 행동별 인지도 증가량 계산"""
-        awareness_gains = {
-            AdvertisingAction.FLYER: 5.0,
-            AdvertisingAction.ONLINE_AD: 8.0,
-            AdvertisingAction.DELIVERY_APP: 12.0,
-        }
-        
-        return awareness_gains.get(advertising_action, 3.0)
+        return self.ADVERTISING_AWARENESS_GAINS.get(advertising_action, 3.0)
     
     def _generate_action_message(self, specific_action, time_cost: int, fatigue_change: float, exp_gains: Dict[str, int]) -> str:
         """행동 결과 메시지 생성"""
-        action_names = {
-            # 조리
-            CookingAction.PREPARE_INGREDIENTS: "재료를 준비했습니다",
-            CookingAction.COOK: "요리를 했습니다",
-            CookingAction.INSPECT_INGREDIENTS: "재료를 점검했습니다",
-            
-            # 광고
-            AdvertisingAction.FLYER: "전단지를 배포했습니다",
-            AdvertisingAction.ONLINE_AD: "온라인 광고를 집행했습니다",
-            AdvertisingAction.DELIVERY_APP: "배달앱에 등록했습니다",
-            
-            # 운영
-            OperationAction.ORDER_INGREDIENTS: "재료를 주문했습니다",
-            OperationAction.CLEAN: "매장을 청소했습니다",
-            OperationAction.EQUIPMENT_CHECK: "장비를 점검했습니다",
-            OperationAction.HIRE_PARTTIME: "아르바이트생을 고용했습니다",
-            
-            # 연구
-            ResearchAction.RECIPE: "레시피를 연구했습니다",
-            ResearchAction.MANAGEMENT: "경영을 연구했습니다",
-            ResearchAction.ADVERTISING_RESEARCH: "광고를 연구했습니다",
-            ResearchAction.SERVICE: "서비스를 연구했습니다",
-            
-            # 개인
-            PersonalAction.VACATION: "휴가를 보냈습니다",
-            PersonalAction.STUDY: "공부를 했습니다",
-            PersonalAction.EXERCISE: "운동을 했습니다",
-            
-            # 휴식
-            RestAction.SLEEP: "잠을 잤습니다",
-        }
-        
-        base_message = action_names.get(specific_action, "행동을 수행했습니다")
+        base_message = self.ACTION_RESULT_MESSAGES.get(specific_action, "행동을 수행했습니다")
         base_message += f" ({time_cost}시간 소모)"
         
         if fatigue_change > 0:
@@ -554,72 +622,8 @@ class ActionService:
     
     def _get_action_display_name(self, action) -> str:
         """행동 표시 이름 반환"""
-        display_names = {
-            # 조리
-            CookingAction.PREPARE_INGREDIENTS: "재료 준비",
-            CookingAction.COOK: "조리",
-            CookingAction.INSPECT_INGREDIENTS: "재료 점검",
-            
-            # 광고
-            AdvertisingAction.FLYER: "전단지 배포",
-            AdvertisingAction.ONLINE_AD: "온라인 광고",
-            AdvertisingAction.DELIVERY_APP: "배달앱 등록",
-            
-            # 운영
-            OperationAction.ORDER_INGREDIENTS: "재료 주문",
-            OperationAction.CLEAN: "매장 청소",
-            OperationAction.EQUIPMENT_CHECK: "장비 점검",
-            OperationAction.HIRE_PARTTIME: "아르바이트생 고용",
-            
-            # 연구
-            ResearchAction.RECIPE: "레시피 연구",
-            ResearchAction.MANAGEMENT: "경영 연구",
-            ResearchAction.ADVERTISING_RESEARCH: "광고 연구",
-            ResearchAction.SERVICE: "서비스 연구",
-            
-            # 개인
-            PersonalAction.VACATION: "휴가",
-            PersonalAction.STUDY: "학습",
-            PersonalAction.EXERCISE: "운동",
-            
-            # 휴식
-            RestAction.SLEEP: "수면",
-        }
-        
-        return display_names.get(action, str(action))
+        return self.ACTION_DISPLAY_NAMES.get(action, str(action))
     
     def _get_action_description(self, action) -> str:
         """행동 설명 반환"""
-        descriptions = {
-            # 조리
-            CookingAction.PREPARE_INGREDIENTS: "요리에 필요한 재료를 준비합니다. 요리 스킬이 향상됩니다.",
-            CookingAction.COOK: "실제로 요리를 합니다. 요리 스킬이 크게 향상됩니다.",
-            CookingAction.INSPECT_INGREDIENTS: "재료의 상태를 확인합니다. 요리와 경영 스킬이 향상됩니다.",
-            
-            # 광고
-            AdvertisingAction.FLYER: "전단지를 제작하고 배포합니다. 매장 인지도가 증가합니다.",
-            AdvertisingAction.ONLINE_AD: "온라인 광고를 집행합니다. 매장 인지도가 크게 증가합니다.",
-            AdvertisingAction.DELIVERY_APP: "배달앱에 매장을 등록합니다. 매장 인지도와 배달 주문이 증가합니다.",
-            
-            # 운영
-            OperationAction.ORDER_INGREDIENTS: "필요한 재료를 주문합니다. 경영 스킬이 향상됩니다.",
-            OperationAction.CLEAN: "매장을 깨끗하게 청소합니다. 서비스 스킬이 향상됩니다.",
-            OperationAction.EQUIPMENT_CHECK: "장비 상태를 점검하고 정비합니다. 기술과 경영 스킬이 향상됩니다.",
-            OperationAction.HIRE_PARTTIME: "아르바이트생을 고용합니다. 경영과 서비스 스킬이 향상됩니다.",
-            
-            # 연구
-            ResearchAction.RECIPE: "새로운 레시피를 연구합니다. 요리 스킬이 크게 향상됩니다.",
-            ResearchAction.MANAGEMENT: "경영 기법을 연구합니다. 경영 스킬이 크게 향상됩니다.",
-            ResearchAction.ADVERTISING_RESEARCH: "광고 전략을 연구합니다. 경영과 기술 스킬이 향상됩니다.",
-            ResearchAction.SERVICE: "서비스 방법을 연구합니다. 서비스 스킬이 크게 향상됩니다.",
-            
-            # 개인
-            PersonalAction.VACATION: "휴가를 보내며 휴식합니다. 피로도가 크게 감소하고 체력이 향상됩니다.",
-            PersonalAction.STUDY: "새로운 지식을 학습합니다. 기술과 경영 스킬이 향상됩니다.",
-            PersonalAction.EXERCISE: "운동을 하여 체력을 기릅니다. 체력이 크게 향상됩니다.",
-            
-            # 휴식
-            RestAction.SLEEP: "잠을 자며 피로를 회복합니다. 피로도가 감소하고 체력이 향상됩니다.",
-        }
-        
-        return descriptions.get(action, "행동을 수행합니다.")
\ No newline at end of file
+        return self.ACTION_DESCRIPTIONS.get(action, "행동을 수행합니다.")
\ No newline at end of file
@@ -6,26 +6,49 @@
 """
 
 from datetime import date, timedelta
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 from uuid import UUID, uuid4
 
-from core.domain.turn import Turn, GamePhase, TurnResult, GameCalendar
+from core.domain.turn import Turn, GamePhase, TurnResult, GameCalendar, get_phase_name
 from core.domain.player import Player
-from core.ports.repository_port import RepositoryPort
+
+if TYPE_CHECKING:
+    # 생성자 주입으로만 쓰이는 인터페이스 - 런타임 임포트 불필요
+    from core.ports.repository_port import RepositoryPort
+
+
+# 한 턴의 페이즈 수 (페이즈 커서는 GamePhase 값과 같음)
+_PHASE_COUNT = len(GamePhase)
 
 
 class GameLoopService:
     """게임 루프 응용 서비스"""
     
-    def __init__(self, repository: RepositoryPort):
+    def __init__(self, repository: "RepositoryPort", verbose: bool = True, save_every_phase: bool = False):
         """
         Args:
             repository: 게임 데이터 저장소
+            verbose: 진행 상황 출력 여부 (헤드리스 시뮬레이션에서는 False)
+            save_every_phase: 페이즈마다 턴을 저장할지 여부 (기본값: 턴 시작 시에만 저장)
         """
         self._repository = repository
-        self._current_turn: Optional[Turn] = None
+        self._verbose = verbose
+        self._save_every_phase = save_every_phase
+        self._current_turn: Optional[Turn] = None  # 마지막으로 만든 턴 스냅샷
+        self._phase_cursor = 0  # 현재 페이즈 인덱스 (턴 내에서는 이 값만 갱신)
         self._game_calendar: Optional[GameCalendar] = None
         self._is_running = False
+        self._dirty_turn = False  # 저장되지 않은 턴 변경 여부
+        
+        # 페이즈별 실행 핸들러 (if/elif 분기 대신 테이블 조회)
+        self._phase_handlers = {
+            GamePhase.PLAYER_ACTION: self._execute_player_action_phase,
+            GamePhase.AI_ACTION: self._execute_ai_action_phase,
+            GamePhase.EVENT: self._execute_event_phase,
+            GamePhase.SALES: self._execute_sales_phase,
+            GamePhase.SETTLEMENT: self._execute_settlement_phase,
+            GamePhase.CLEANUP: self._execute_cleanup_phase,
+        }
     
     def start_new_game(self, player: Player, start_date: date = None) -> Turn:
         """새 게임을 시작합니다.
@@ -40,6 +63,9 @@ class GameLoopService:
         if start_date is None:
             start_date = date.today()
         
+        # 이전 게임의 저장되지 않은 진행 상태를 먼저 기록
+        self.flush()
+        
         # 첫 번째 턴 생성
         first_turn = Turn(
             turn_number=1,
@@ -55,15 +81,20 @@ class GameLoopService:
         )
         
         self._current_turn = first_turn
+        self._phase_cursor = int(first_turn.current_phase)
         self._is_running = True
+        self._dirty_turn = False
         
         # 플레이어와 턴 정보 저장
         self._repository.save_player(player)
         self._repository.save_turn(first_turn)
         
-        print(f"🎮 새 게임 시작: {player.name}")
-        print(f"📅 시작 날짜: {start_date}")
-        print(f"🔄 첫 번째 턴: {first_turn.get_display_info()}")
+        if self._verbose:
+            print(
+                f"🎮 새 게임 시작: {player.name}\n"
+                f"📅 시작 날짜: {start_date}\n"
+                f"🔄 첫 번째 턴: {first_turn.get_display_info()}"
+            )
         
         return first_turn
     
@@ -76,6 +107,9 @@ class GameLoopService:
         Returns:
             Optional[Turn]: 현재 턴 또는 None (불러오기 실패)
         """
+        # 이전 게임의 저장되지 않은 진행 상태를 먼저 기록
+        self.flush()
+        
         game_data = self._repository.load_game(save_name)
         if not game_data:
             return None
@@ -86,7 +120,9 @@ class GameLoopService:
             return None
         
         self._current_turn = current_turn
+        self._phase_cursor = int(current_turn.current_phase)
         self._is_running = True
+        self._dirty_turn = False
         
         # 게임 달력 복원 (간단한 구현)
         start_date = game_data.get('start_date', current_turn.game_date)
@@ -98,18 +134,31 @@ class GameLoopService:
             current_turn=current_turn
         )
         
-        print(f"📂 게임 불러오기 성공: {save_name}")
-        print(f"🔄 현재 턴: {current_turn.get_display_info()}")
+        if self._verbose:
+            print(
+                f"📂 게임 불러오기 성공: {save_name}\n"
+                f"🔄 현재 턴: {current_turn.get_display_info()}"
+            )
         
         return current_turn
     
     def get_current_turn(self) -> Optional[Turn]:
-        """현재 턴 정보를 반환합니다."""
-        return self._current_turn
+        """현재 턴 정보를 반환합니다.
+        
+        페이즈 커서가 스냅샷보다 앞서 있으면 이때 새 Turn을 만듭니다.
+        """
+        turn = self._current_turn
+        if turn is None:
+            return None
+        
+        phase = GamePhase(self._phase_cursor)
+        if turn.current_phase is not phase:
+            turn = self._current_turn = turn._replace(current_phase=phase)
+        return turn
     
     def get_current_phase(self) -> Optional[GamePhase]:
         """현재 게임 페이즈를 반환합니다."""
-        return self._current_turn.current_phase if self._current_turn else None
+        return GamePhase(self._phase_cursor) if self._current_turn else None
     
     def is_game_running(self) -> bool:
         """게임이 실행 중인지 확인합니다."""
@@ -124,23 +173,74 @@ class GameLoopService:
         if not self._current_turn or not self._is_running:
             return None
         
-        print(f"⏭️  페이즈 진행: {self._current_turn.get_phase_name()} → ", end="")
+        self._step_phase()
+        return self.get_current_turn()
+    
+    def play_turn(self, phase_data: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """남은 페이즈를 모두 실행하고 다음 턴으로 넘어갑니다.
+        
+        헤드리스 시뮬레이션용으로, 턴 중간에는 Turn 객체를 만들지 않습니다.
+        
+        Args:
+            phase_data: 각 페이즈 실행에 전달할 데이터
+            
+        Returns:
+            List[Dict[str, Any]]: 페이즈별 실행 결과
+        """
+        results = []
+        if not self._current_turn or not self._is_running:
+            return results
+        
+        while True:
+            results.append(self.execute_turn_phase(phase_data))
+            if self._step_phase():
+                return results
+    
+    def _step_phase(self) -> bool:
+        """페이즈 커서를 한 칸 진행합니다.
         
-        # 다음 페이즈로 진행
-        next_turn = self._current_turn.advance_phase()
+        Returns:
+            bool: 새 턴이 시작되었으면 True
+        """
+        # 로그용 페이즈는 커서로 바로 조회 (Turn 스냅샷을 만들지 않음)
+        previous_phase = GamePhase(self._phase_cursor)
         
-        if next_turn.is_complete:
+        cursor = self._phase_cursor + 1
+        turn_started = cursor == _PHASE_COUNT
+        if turn_started:
             # 턴 완료 - 다음 턴으로 이동
-            self._current_turn = next_turn  # 완료된 턴으로 먼저 업데이트
-            next_turn = self._start_next_turn()
-            print("다음 턴")
+            self._current_turn = self._current_turn._replace(
+                current_phase=previous_phase, is_complete=True
+            )
+            self._current_turn = self._start_next_turn()
+            self._phase_cursor = int(self._current_turn.current_phase)
+            if self._verbose:
+                print(f"⏭️  페이즈 진행: {get_phase_name(previous_phase)} → 다음 턴")
         else:
-            print(f"{next_turn.get_phase_name()}")
+            self._phase_cursor = cursor
+            if self._verbose:
+                print(f"⏭️  페이즈 진행: {get_phase_name(previous_phase)} → {get_phase_name(GamePhase(cursor))}")
         
-        self._current_turn = next_turn
-        self._repository.save_turn(next_turn)
+        self._dirty_turn = True
         
-        return next_turn
+        # 저장은 턴 단위로 모아서 수행 (페이즈마다 저장하지 않음)
+        if turn_started or self._save_every_phase:
+            self.flush()
+        
+        return turn_started
+    
+    def flush(self) -> bool:
+        """저장되지 않은 턴 변경 사항을 저장소에 기록합니다.
+        
+        Returns:
+            bool: 저장을 수행했으면 True, 저장할 변경이 없으면 False
+        """
+        if not self._dirty_turn or not self._current_turn:
+            return False
+        
+        self._repository.save_turn(self.get_current_turn())
+        self._dirty_turn = False
+        return True
     
     def execute_turn_phase(self, phase_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """현재 페이즈를 실행합니다.
@@ -154,27 +254,19 @@ class GameLoopService:
         if not self._current_turn or not self._is_running:
             return {"error": "게임이 실행 중이 아닙니다"}
         
-        current_phase = self._current_turn.current_phase
+        current_phase = GamePhase(self._phase_cursor)
         result = {"phase": current_phase.name, "success": True}
         
         try:
-            if current_phase == GamePhase.PLAYER_ACTION:
-                result.update(self._execute_player_action_phase(phase_data))
-            elif current_phase == GamePhase.AI_ACTION:
-                result.update(self._execute_ai_action_phase(phase_data))
-            elif current_phase == GamePhase.EVENT:
-                result.update(self._execute_event_phase(phase_data))
-            elif current_phase == GamePhase.SALES:
-                result.update(self._execute_sales_phase(phase_data))
-            elif current_phase == GamePhase.SETTLEMENT:
-                result.update(self._execute_settlement_phase(phase_data))
-            elif current_phase == GamePhase.CLEANUP:
-                result.update(self._execute_cleanup_phase(phase_data))
+            handler = self._phase_handlers.get(current_phase)
+            if handler:
+                result.update(handler(phase_data))
             
         except Exception as e:
             result["success"] = False
             result["error"] = str(e)
-            print(f"❌ 페이즈 실행 실패: {e}")
+            if self._verbose:
+                print(f"❌ 페이즈 실행 실패: {e}")
         
         return result
     
@@ -194,14 +286,13 @@ class GameLoopService:
             updated_calendar = self._game_calendar._replace(current_turn=self._current_turn)
             self._game_calendar = updated_calendar.advance_turn()
         
-        print(f"📅 새로운 턴 시작: {next_turn.get_display_info()}")
+        if self._verbose:
+            print(f"📅 새로운 턴 시작: {next_turn.get_display_info()}")
         
         return next_turn
     
     def _execute_player_action_phase(self, phase_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """플레이어 행동 페이즈 실행"""
-        print("🎮 플레이어 행동 페이즈")
-        
         # 플레이어 행동 처리 (기본 구현)
         actions = phase_data.get("actions", []) if phase_data else []
         
@@ -211,14 +302,13 @@ class GameLoopService:
             "time_remaining": 12  # 기본 12시간
         }
         
-        print(f"   - 실행된 행동 수: {len(actions)}")
+        if self._verbose:
+            print(f"🎮 플레이어 행동 페이즈\n   - 실행된 행동 수: {len(actions)}")
         
         return result
     
     def _execute_ai_action_phase(self, phase_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """AI 행동 페이즈 실행"""
-        print("🤖 AI 행동 페이즈")
-        
         # AI 행동 처리 (기본 구현)
         ai_actions = ["경쟁자 AI 행동 처리"]
         
@@ -227,14 +317,13 @@ class GameLoopService:
             "competitors_processed": 0  # 현재 경쟁자 없음
         }
         
-        print(f"   - 처리된 AI 행동: {len(ai_actions)}")
+        if self._verbose:
+            print(f"🤖 AI 행동 페이즈\n   - 처리된 AI 행동: {len(ai_actions)}")
         
         return result
     
     def _execute_event_phase(self, phase_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """이벤트 페이즈 실행"""
-        print("🎲 이벤트 페이즈")
-        
         # 이벤트 처리 (기본 구현)
         event_occurred = False  # 임시로 이벤트 없음
         
@@ -244,17 +333,16 @@ class GameLoopService:
             "event_result": None
         }
         
-        if event_occurred:
-            print("   - 이벤트 발생!")
-        else:
-            print("   - 이벤트 없음")
+        if self._verbose:
+            if event_occurred:
+                print("🎲 이벤트 페이즈\n   - 이벤트 발생!")
+            else:
+                print("🎲 이벤트 페이즈\n   - 이벤트 없음")
         
         return result
     
     def _execute_sales_phase(self, phase_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """판매 페이즈 실행"""
-        print("💰 판매 페이즈")
-        
         # 판매 처리 (기본 구현)
         total_sales = 0
         customer_count = 0
@@ -265,15 +353,17 @@ class GameLoopService:
             "products_sold": {}
         }
         
-        print(f"   - 총 매출: ₩{total_sales:,}")
-        print(f"   - 고객 수: {customer_count}명")
+        if self._verbose:
+            print(
+                "💰 판매 페이즈\n"
+                f"   - 총 매출: ₩{total_sales:,}\n"
+                f"   - 고객 수: {customer_count}명"
+            )
         
         return result
     
     def _execute_settlement_phase(self, phase_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """정산 페이즈 실행"""
-        print("📊 정산 페이즈")
-        
         # 정산 처리 (기본 구현)
         revenue = 0
         costs = 0
@@ -286,23 +376,26 @@ class GameLoopService:
             "is_profitable": profit > 0
         }
         
-        print(f"   - 매출: ₩{revenue:,}")
-        print(f"   - 비용: ₩{costs:,}")
-        print(f"   - 순이익: ₩{profit:,}")
+        if self._verbose:
+            print(
+                "📊 정산 페이즈\n"
+                f"   - 매출: ₩{revenue:,}\n"
+                f"   - 비용: ₩{costs:,}\n"
+                f"   - 순이익: ₩{profit:,}"
+            )
         
         return result
     
     def _execute_cleanup_phase(self, phase_data: Dict[str, Any] = None) -> Dict[str, Any]:
         """마무리 페이즈 실행"""
-        print("🧹 마무리 페이즈")
-        
         # 마무리 처리 (기본 구현)
         result = {
             "cleanup_completed": True,
             "turn_complete": True
         }
         
-        print("   - 턴 마무리 완료")
+        if self._verbose:
+            print("🧹 마무리 페이즈\n   - 턴 마무리 완료")
         
         return result
     
@@ -311,12 +404,13 @@ class GameLoopService:
         if not self._current_turn or not self._game_calendar:
             return {"status": "게임이 시작되지 않음"}
         
+        current_turn = self.get_current_turn()
         return {
             "is_running": self._is_running,
-            "current_turn": self._current_turn.turn_number,
-            "current_date": self._current_turn.game_date.isoformat(),
-            "current_phase": self._current_turn.get_phase_name(),
-            "progress": self._current_turn.get_progress_percentage(),
+            "current_turn": current_turn.turn_number,
+            "current_date": current_turn.game_date.isoformat(),
+            "current_phase": current_turn.get_phase_name(),
+            "progress": current_turn.get_progress_percentage(),
             "days_elapsed": self._game_calendar.get_days_elapsed(),
             "is_weekend": self._game_calendar.is_weekend(),
             "is_month_end": self._game_calendar.is_month_end()
@@ -325,5 +419,7 @@ class GameLoopService:
     def stop_game(self) -> bool:
         """게임을 중지합니다."""
         self._is_running = False
-        print("⏹️  게임 중지")
+        self.flush()
+        if self._verbose:
+            print("⏹️  게임 중지")
         return True 
\ No newline at end of file
@@ -4,7 +4,7 @@
 플레이어 관련 유스케이스를 구현합니다.
 """
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from uuid import UUID, uuid4
 
 from ..dtos.player_dto import (
@@ -15,22 +15,26 @@ from ..dtos.player_dto import (
 )
 from core.domain.player import Player
 from core.domain.value_objects import Money, StatValue, Percentage
-from core.domain.events.player_events import (
-    PlayerCreatedEvent,
-    PlayerMoneyChangedEvent,
-    PlayerStoreAddedEvent
-)
-from core.ports.store_service import IStoreService
-from core.ports.research_service import IResearchService
+
+if TYPE_CHECKING:
+    # 생성자 주입으로만 쓰이는 인터페이스 - 런타임 임포트 불필요
+    from core.ports.store_service import IStoreService
+    from core.ports.research_service import IResearchService
 
 
 class PlayerService:
     """플레이어 응용 서비스"""
     
+    # 행동 유형별 피로도 변화량 (rest: 감소, work: 증가)
+    ACTION_FATIGUE_DELTAS = {
+        "rest": -10,
+        "work": 5,
+    }
+    
     def __init__(
         self,
-        store_service: IStoreService,
-        research_service: IResearchService,
+        store_service: "IStoreService",
+        research_service: "IResearchService",
         event_publisher=None  # 이벤트 발행자 (추후 구현)
     ):
         self._store_service = store_service
@@ -52,7 +56,7 @@ class PlayerService:
             service=StatValue(base_value=preset_stats["service"]),
             tech=StatValue(base_value=preset_stats["tech"]),
             stamina=StatValue(base_value=preset_stats["stamina"]),
-            fatigue=Percentage(0),
+            fatigue=Percentage.ZERO,
             money=Money(request.initial_money),
             store_ids=(),  # 초기에는 매장 없음
             research_ids=()  # 초기에는 연구 없음
@@ -73,6 +77,12 @@ class PlayerService:
         
         # 이벤트 발행
         if self._event_publisher:
+            # 이벤트 발행자가 있을 때만 이벤트 모듈 로드
+            from core.domain.events.player_events import (
+                PlayerCreatedEvent,
+                PlayerStoreAddedEvent
+            )
+            
             self._event_publisher.publish(
                 PlayerCreatedEvent(
                     event_id=uuid4(),
@@ -107,25 +117,39 @@ class PlayerService:
     
     def execute_player_action(self, request: PlayerActionRequest) -> PlayerStatusDto:
         """플레이어 행동 실행"""
-        player = self._players.get(request.player_id)
-        if not player:
-            raise ValueError(f"플레이어를 찾을 수 없습니다: {request.player_id}")
+        return self.execute_player_actions([request])[0]
+    
+    def execute_player_actions(self, requests: List[PlayerActionRequest]) -> List[PlayerStatusDto]:
+        """여러 플레이어 행동을 한 번에 실행
         
-        # 행동 유형에 따른 처리
-        if request.action_type == "rest":
-            # 휴식 - 피로도 감소
-            new_fatigue = Percentage(max(0, player.fatigue.value - 10))
-            player = player._replace(fatigue=new_fatigue)
+        행동별 변화량을 플레이어마다 모아 두었다가 _replace를 한 번만 적용합니다.
+        반환값은 요청에 처음 등장한 순서대로 플레이어별 최종 상태입니다.
+        """
+        pending: Dict[str, List] = {}  # player_id -> [player, fatigue]
         
-        elif request.action_type == "work":
-            # 작업 - 피로도 증가, 경험치 획득
-            new_fatigue = Percentage(min(100, player.fatigue.value + 5))
-            player = player._replace(fatigue=new_fatigue)
+        for request in requests:
+            entry = pending.get(request.player_id)
+            if entry is None:
+                player = self._players.get(request.player_id)
+                if not player:
+                    raise ValueError(f"플레이어를 찾을 수 없습니다: {request.player_id}")
+                entry = pending[request.player_id] = [player, player.fatigue.value]
+            
+            # 행동 유형에 따른 피로도 변화 (행동마다 0~100 범위로 제한)
+            delta = self.ACTION_FATIGUE_DELTAS.get(request.action_type)
+            if delta is not None:
+                entry[1] = max(0, min(100, entry[1] + delta))
         
-        # 저장
-        self._players[request.player_id] = player
+        results = []
+        for player_id, (player, fatigue) in pending.items():
+            if fatigue != player.fatigue.value:
+                player = player._replace(fatigue=Percentage(fatigue))
+            
+            # 저장
+            self._players[player_id] = player
+            results.append(self._convert_to_status_dto(player))
         
-        return self._convert_to_status_dto(player)
+        return results
     
     def _get_character_preset_stats(self, preset: str) -> dict:
         """캐릭터 프리셋 스탯 반환"""
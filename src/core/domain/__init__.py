@@ -22,10 +22,11 @@ from .product import Product, ProductCategory
 from .recipe import Recipe, DefaultRecipes
 from .competitor import Competitor, CompetitorStrategy, DelayedAction
 from .research import Research, ResearchTemplate, DefaultResearchTemplates
-from .inventory import InventoryItem
-from .customer import CustomerAI, CustomerType, CustomerMood, MarketAverages, CustomerDemand
+from .inventory import Inventory
+from .customer import CustomerAI, CustomerDemand, CustomerPopulation
+from .market_averages import MarketAverages
 from .event import Event, EventChoice, EventEffect, EventTemplate
-from .event_loader import EventLoaderPort
+from .event_loader import EventLoaderPort, CachedEventLoader
 from .turn import Turn, GamePhase, TurnResult, GameCalendar
 
 __all__ = [
@@ -64,14 +65,13 @@ __all__ = [
     "DefaultResearchTemplates",
     
     # 재고 관련
-    "InventoryItem",
+    "Inventory",
     
     # 고객 관련
     "CustomerAI",
-    "CustomerType",
-    "CustomerMood",
     "MarketAverages",
     "CustomerDemand",
+    "CustomerPopulation",
     
     # 이벤트 관련
     "Event",
@@ -79,6 +79,7 @@ __all__ = [
     "EventEffect",
     "EventTemplate",
     "EventLoaderPort",
+    "CachedEventLoader",
     
     # 턴 관련
     "Turn",
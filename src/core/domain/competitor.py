@@ -5,20 +5,36 @@ AI가 조종하는 경쟁 치킨집을 나타내는 불변 엔티티입니다.
 플레이어와 경쟁하며 지연 행동 시스템을 가집니다.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Iterable, Optional
 from uuid import UUID
-from datetime import date
-from enum import Enum, auto
+from datetime import date, timedelta
+from enum import IntEnum
+from itertools import islice
 
+from constants import AI_BANKRUPTCY_DAYS
+from .dataclass_utils import fast_replace
 from .value_objects import Money
 
 
-class CompetitorStrategy(Enum):
-    """경쟁자 전략 유형"""
+class CompetitorStrategy(IntEnum):
+    """경쟁자 전략 유형 (값은 설명 테이블 인덱스)"""
     
-    AGGRESSIVE = auto()  # 공격적 전략 (가격 인하, 마케팅 강화)
-    DEFENSIVE = auto()  # 방어적 전략 (품질 유지, 비용 절감)
+    AGGRESSIVE = 0  # 공격적 전략 (가격 인하, 마케팅 강화)
+    DEFENSIVE = 1  # 방어적 전략 (품질 유지, 비용 절감)
+
+
+# 전략별 설명 (CompetitorStrategy 값 순서, 호출마다 딕셔너리를 만들지 않도록 모듈 상수로 유지)
+_STRATEGY_DESCRIPTIONS = (
+    "공격적 전략 - 가격 인하와 마케팅 강화로 시장 점유율 확대",
+    "방어적 전략 - 품질 유지와 비용 절감으로 안정적 운영",
+)
+
+
+# 지연 행동 정렬 키 (실행 턴)
+_TARGET_TURN = attrgetter('target_turn')
 
 
 @dataclass(frozen=True)
@@ -49,12 +65,15 @@ class Competitor:
     # 소유 매장들 (ID 참조)
     store_ids: tuple[UUID, ...]
     
-    # 지연 행동 큐
+    # 지연 행동 큐 (target_turn 오름차순 정렬 유지)
     delayed_actions: tuple[DelayedAction, ...]
     
     # 파산 관련
     bankrupt_since: Optional[date] = None  # 파산 시작일
     
+    # 제거 예정일 (파산 시작일로부터 생성 시 한 번만 계산)
+    elimination_date: Optional[date] = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """생성 후 유효성 검사"""
         if not self.name.strip():
@@ -62,44 +81,59 @@ class Competitor:
         
         if len(self.store_ids) == 0:
             raise ValueError("경쟁자는 최소 1개의 매장을 가져야 합니다")
+        
+        # 지연 행동은 실행 턴 순으로 정렬 (같은 턴은 추가 순서 유지)
+        # 내부 복사는 이미 정렬된 큐를 넘기므로 복사 없이 한 번 훑어보기만 함
+        actions = self.delayed_actions
+        if len(actions) > 1 and not all(
+            a.target_turn <= b.target_turn for a, b in zip(actions, islice(actions, 1, None))
+        ):
+            object.__setattr__(self, 'delayed_actions', tuple(sorted(actions, key=_TARGET_TURN)))
+        
+        if self.bankrupt_since is None:
+            object.__setattr__(self, 'elimination_date', None)
+        else:
+            object.__setattr__(
+                self, 'elimination_date', self.bankrupt_since + timedelta(days=AI_BANKRUPTCY_DAYS)
+            )
     
     def spend_money(self, amount: Money) -> 'Competitor':
         """자금 사용 후 새로운 Competitor 반환"""
-        new_money = self.money - amount
-        return self._replace(money=new_money)
+        return self._replace(money=self.money - amount)
     
     def earn_money(self, amount: Money) -> 'Competitor':
         """자금 획득 후 새로운 Competitor 반환"""
-        new_money = self.money + amount
-        return self._replace(money=new_money)
+        return self._replace(money=self.money + amount)
     
     def add_delayed_action(self, action: DelayedAction) -> 'Competitor':
         """지연 행동 추가 후 새로운 Competitor 반환"""
-        new_actions = self.delayed_actions + (action,)
+        actions = self.delayed_actions
+        index = bisect_right(actions, action.target_turn, key=_TARGET_TURN)
+        new_actions = actions[:index] + (action,) + actions[index:]
         return self._replace(delayed_actions=new_actions)
     
     def remove_delayed_action(self, action_id: UUID) -> 'Competitor':
         """지연 행동 제거 후 새로운 Competitor 반환"""
-        new_actions = tuple(
-            action for action in self.delayed_actions 
-            if action.id != action_id
-        )
-        return self._replace(delayed_actions=new_actions)
+        actions = self.delayed_actions
+        for index, action in enumerate(actions):
+            if action.id == action_id:
+                # 찾은 위치만 잘라내 정렬 순서 유지
+                return self._replace(delayed_actions=actions[:index] + actions[index + 1:])
+        
+        return self  # 해당 행동 없음 - 변경 없음
     
     def get_ready_actions(self, current_turn: int) -> list[DelayedAction]:
-        """현재 턴에 실행 가능한 행동들 반환"""
-        return [
-            action for action in self.delayed_actions
-            if action.is_ready_to_execute(current_turn)
-        ]
+        """현재 턴에 실행 가능한 행동들 반환 (정렬된 큐의 앞부분)"""
+        actions = self.delayed_actions
+        return list(actions[:bisect_right(actions, current_turn, key=_TARGET_TURN)])
     
     def execute_ready_actions(self, current_turn: int) -> 'Competitor':
         """실행 가능한 행동들 제거 후 새로운 Competitor 반환"""
-        remaining_actions = tuple(
-            action for action in self.delayed_actions
-            if not action.is_ready_to_execute(current_turn)
-        )
-        return self._replace(delayed_actions=remaining_actions)
+        actions = self.delayed_actions
+        index = bisect_right(actions, current_turn, key=_TARGET_TURN)
+        if index == 0:
+            return self
+        return self._replace(delayed_actions=actions[index:])
     
     def is_bankrupt(self) -> bool:
         """파산 상태인지 확인 (자금 0원)"""
@@ -122,12 +156,7 @@ class Competitor:
     
     def should_be_eliminated(self, current_date: date) -> bool:
         """제거되어야 하는지 확인 (30일 파산 지속)"""
-        from constants import AI_BANKRUPTCY_DAYS
-        
-        if self.bankrupt_since is None:
-            return False
-        
-        return self.get_bankruptcy_duration_days(current_date) >= AI_BANKRUPTCY_DAYS
+        return self.elimination_date is not None and current_date >= self.elimination_date
     
     def add_store(self, store_id: UUID) -> 'Competitor':
         """매장 추가 후 새로운 Competitor 반환"""
@@ -136,13 +165,25 @@ class Competitor:
     
     def get_strategy_description(self) -> str:
         """전략 설명 반환"""
-        strategy_descriptions = {
-            CompetitorStrategy.AGGRESSIVE: "공격적 전략 - 가격 인하와 마케팅 강화로 시장 점유율 확대",
-            CompetitorStrategy.DEFENSIVE: "방어적 전략 - 품질 유지와 비용 절감으로 안정적 운영"
-        }
-        return strategy_descriptions.get(self.strategy, "알 수 없는 전략")
+        if isinstance(self.strategy, CompetitorStrategy):
+            return _STRATEGY_DESCRIPTIONS[self.strategy]
+        return "알 수 없는 전략"
     
     def _replace(self, **changes) -> 'Competitor':
         """dataclass replace 메서드 래퍼"""
-        from dataclasses import replace
-        return replace(self, **changes) 
\ No newline at end of file
+        return fast_replace(self, changes)
+
+
+def collect_ready(competitors: Iterable[Competitor], current_turn: int) -> dict[UUID, list[DelayedAction]]:
+    """여러 경쟁자의 실행 가능한 지연 행동을 한 번에 수집
+    
+    각 경쟁자의 정렬된 큐에서 실행 가능한 앞부분만 잘라 오므로
+    대기 중인 전체 행동이 아니라 실행될 행동 수에 비례합니다.
+    실행 가능한 행동이 없는 경쟁자는 결과에 포함하지 않습니다.
+    """
+    ready: dict[UUID, list[DelayedAction]] = {}
+    for competitor in competitors:
+        actions = competitor.delayed_actions
+        if actions and actions[0].target_turn <= current_turn:
+            ready[competitor.id] = list(actions[:bisect_right(actions, current_turn, key=_TARGET_TURN)])
+    return ready
@@ -5,11 +5,39 @@
 10% AI 고객과 90% 수치 계산 고객으로 구성됩니다.
 """
 
+from array import array
 from dataclasses import dataclass
+from functools import lru_cache
 from uuid import UUID
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 
+from .dataclass_utils import fast_replace
 from .value_objects import Money, Percentage
+from .market_averages import MarketAverages
+
+
+# 주사위 값별 일일 욕구 증가량 (0~100 범위는 미리 만들어 재사용)
+_DESIRE_INCREMENTS = {dice_value: Percentage(dice_value / 10) for dice_value in range(0, 101)}
+
+
+def _product_scores(
+    price: Money, quality: int, awareness: int, market_averages: MarketAverages
+) -> tuple[float, float, float]:
+    """제품의 (가격, 품질, 인지도) 점수 (시장 평균 대비, 평균이 0인 항목은 50점)"""
+    average_price = market_averages.average_price.amount
+    average_quality = market_averages.average_quality
+    average_awareness = market_averages.average_awareness
+    
+    # 가격 점수 (낮을수록 좋음)
+    price_score = 50.0 if average_price == 0 else max(0, 100 - (price.amount / average_price * 50))
+    
+    # 품질 점수 (높을수록 좋음)
+    quality_score = 50.0 if average_quality == 0 else min(100, quality / average_quality * 50)
+    
+    # 인지도 점수 (높을수록 좋음)
+    awareness_score = 50.0 if average_awareness == 0 else min(100, awareness / average_awareness * 50)
+    
+    return price_score, quality_score, awareness_score
 
 
 @dataclass(frozen=True)
@@ -43,64 +71,57 @@ class CustomerAI:
             raise ValueError("브랜드 충성도는 0.0~1.0 사이여야 합니다")
     
     def evaluate_product(self, price: Money, quality: int, awareness: int, market_averages: 'MarketAverages') -> float:
-        """제품 평가 점수 계산"""
-        # 가격 점수 (낮을수록 좋음)
-        price_score = self._calculate_price_score(price, market_averages.average_price)
-        
-        # 품질 점수 (높을수록 좋음)
-        quality_score = self._calculate_quality_score(quality, market_averages.average_quality)
-        
-        # 인지도 점수 (높을수록 좋음)
-        awareness_score = self._calculate_awareness_score(awareness, market_averages.average_awareness)
+        """제품 평가 점수 계산 (시장 평균 대비, 평균이 0인 항목은 50점)"""
+        price_score, quality_score, awareness_score = _product_scores(
+            price, quality, awareness, market_averages
+        )
         
         # 가중 평균 계산
-        weighted_score = (
+        return (
             price_score * self.price_sensitivity +
             quality_score * self.quality_preference +
             awareness_score * (1 - self.brand_loyalty)
         )
-        
-        return weighted_score
     
-    def _calculate_price_score(self, price: Money, market_average: Money) -> float:
-        """가격 점수 계산 (시장 평균 대비)"""
-        if market_average.is_zero():
-            return 50.0
+    def evaluate_products(
+        self,
+        offers: Sequence[tuple[Money, int, int]],
+        market_averages: 'MarketAverages'
+    ) -> list[float]:
+        """여러 제품을 한 번에 평가 (evaluate_product와 같은 점수)
         
-        # 가격이 낮을수록 높은 점수
-        ratio = price.amount / market_average.amount
-        return max(0, 100 - (ratio * 50))
-    
-    def _calculate_quality_score(self, quality: int, market_average: float) -> float:
-        """품질 점수 계산 (시장 평균 대비)"""
-        if market_average == 0:
-            return 50.0
+        Args:
+            offers: (가격, 품질, 인지도) 튜플 목록
+            market_averages: 시장 평균 데이터
+        """
+        # 제품마다 바뀌지 않는 가중치는 루프 밖에서 한 번만 계산
+        price_weight = self.price_sensitivity
+        quality_weight = self.quality_preference
+        awareness_weight = 1 - self.brand_loyalty
         
-        # 품질이 높을수록 높은 점수
-        ratio = quality / market_average
-        return min(100, ratio * 50)
-    
-    def _calculate_awareness_score(self, awareness: int, market_average: float) -> float:
-        """인지도 점수 계산 (시장 평균 대비)"""
-        if market_average == 0:
-            return 50.0
+        scores = []
+        for price, quality, awareness in offers:
+            price_score, quality_score, awareness_score = _product_scores(
+                price, quality, awareness, market_averages
+            )
+            scores.append(
+                price_score * price_weight +
+                quality_score * quality_weight +
+                awareness_score * awareness_weight
+            )
         
-        # 인지도가 높을수록 높은 점수
-        ratio = awareness / market_average
-        return min(100, ratio * 50)
+        return scores
     
     def record_purchase(self, store_id: UUID) -> 'CustomerAI':
         """구매 기록 업데이트 및 욕구 초기화"""
-        return self._replace(
-            last_purchase_store_id=store_id,
-            desire=Percentage(0)
-        )
+        return self._replace(desire=_DESIRE_INCREMENTS[0], last_purchase_store_id=store_id)
     
     def update_daily_desire(self, dice_value: int) -> 'CustomerAI':
         """매일 욕구 업데이트 (Calldice의 값/10 만큼 증가)"""
-        desire_increase = Percentage(dice_value / 10)
-        new_desire = self.desire + desire_increase
-        return self._replace(desire=new_desire)
+        desire_increase = _DESIRE_INCREMENTS.get(dice_value)
+        if desire_increase is None:
+            desire_increase = Percentage(dice_value / 10)
+        return self._replace(desire=self.desire + desire_increase)
     
     def get_purchase_probability(self, market_share: Percentage) -> float:
         """구매 확률 계산 ([욕구]% * [점유율]%)"""
@@ -108,17 +129,97 @@ class CustomerAI:
     
     def _replace(self, **changes) -> 'CustomerAI':
         """dataclass replace 메서드 래퍼"""
-        from dataclasses import replace
-        return replace(self, **changes)
+        return fast_replace(self, changes)
 
 
-@dataclass(frozen=True)
-class MarketAverages:
-    """시장 평균 데이터 (고객 평가용)"""
+# CustomerPopulation 수치 배열 타입 코드 ('d' = 배정밀도 실수, 파이썬 float와 동일)
+# 단정밀도를 쓰면 get_customer 결과와 점수 계산이 CustomerAI와 달라지므로 사용하지 않음
+_TRAIT_TYPECODE = 'd'
+
+
+class CustomerPopulation:
+    """AI 고객 집단 (속성별 병렬 배열 저장)
     
-    average_price: Money
-    average_quality: float
-    average_awareness: float
+    고객마다 CustomerAI 객체를 두는 대신 속성별 배열에 모아
+    매 턴 전체 고객을 처리하는 연산이 배열 하나만 순회하도록 합니다.
+    개별 고객이 필요한 코드는 get_customer로 CustomerAI를 만들어 사용합니다.
+    """
+    
+    def __init__(self, customers: Iterable[CustomerAI] = ()):
+        self.ids: list[UUID] = []
+        self.names: list[str] = []
+        self.price_sensitivity = array(_TRAIT_TYPECODE)
+        self.quality_preference = array(_TRAIT_TYPECODE)
+        self.brand_loyalty = array(_TRAIT_TYPECODE)
+        self.desire = array(_TRAIT_TYPECODE)  # 욕구 (0~100)
+        self.last_purchase_store_ids: list[Optional[UUID]] = []
+        
+        for customer in customers:
+            self.add(customer)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def add(self, customer: CustomerAI) -> int:
+        """고객 추가 후 인덱스 반환 (검증은 CustomerAI 생성 시 완료됨)"""
+        self.ids.append(customer.id)
+        self.names.append(customer.name)
+        self.price_sensitivity.append(customer.price_sensitivity)
+        self.quality_preference.append(customer.quality_preference)
+        self.brand_loyalty.append(customer.brand_loyalty)
+        self.desire.append(customer.desire.value)
+        self.last_purchase_store_ids.append(customer.last_purchase_store_id)
+        return len(self.ids) - 1
+    
+    def get_customer(self, index: int) -> CustomerAI:
+        """인덱스 위치의 고객을 CustomerAI로 반환"""
+        return CustomerAI(
+            id=self.ids[index],
+            name=self.names[index],
+            price_sensitivity=self.price_sensitivity[index],
+            quality_preference=self.quality_preference[index],
+            brand_loyalty=self.brand_loyalty[index],
+            desire=Percentage(self.desire[index]),
+            last_purchase_store_id=self.last_purchase_store_ids[index]
+        )
+    
+    def evaluate_product(
+        self,
+        price: Money,
+        quality: int,
+        awareness: int,
+        market_averages: 'MarketAverages'
+    ) -> array:
+        """전체 고객의 제품 평가 점수 (고객 순서, CustomerAI.evaluate_product와 같은 식)"""
+        # 가격·품질·인지도 점수는 고객과 무관하므로 한 번만 계산
+        price_score, quality_score, awareness_score = _product_scores(
+            price, quality, awareness, market_averages
+        )
+        
+        # 고객별로는 가중치만 다름 - 배열을 나란히 한 번 순회
+        return array('d', [
+            price_score * price_weight +
+            quality_score * quality_weight +
+            awareness_score * (1 - loyalty)
+            for price_weight, quality_weight, loyalty in zip(
+                self.price_sensitivity, self.quality_preference, self.brand_loyalty
+            )
+        ])
+    
+    def update_daily_desire(self, dice_values: Sequence[int]) -> None:
+        """전체 고객 욕구 업데이트 (고객별 Calldice 값/10 만큼 증가, 최대 100)"""
+        desire = self.desire
+        if len(dice_values) != len(desire):
+            raise ValueError("주사위 값 개수가 고객 수와 일치하지 않습니다")
+        
+        for index, dice_value in enumerate(dice_values):
+            value = desire[index] + dice_value / 10
+            desire[index] = 100.0 if value > 100 else value
+    
+    def record_purchase(self, index: int, store_id: UUID) -> None:
+        """구매 기록 업데이트 및 욕구 초기화"""
+        self.last_purchase_store_ids[index] = store_id
+        self.desire[index] = 0.0
 
 
 @dataclass(frozen=True)
@@ -134,10 +235,19 @@ class CustomerDemand:
         if self.total_customers != self.ai_customers + self.numerical_customers:
             raise ValueError("총 고객 수가 AI 고객 수 + 수치적 고객 수와 일치하지 않습니다")
         
+        if self.total_customers == 0:
+            return  # 고객이 없으면 비율 검사 생략
+        
         expected_ai_ratio = self.ai_customers / self.total_customers
         if not 0.09 <= expected_ai_ratio <= 0.11:  # 10% ± 1% 허용
             raise ValueError("AI 고객 비율이 10% 근처가 아닙니다")
     
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def create(cls, total_customers: int, ai_customers: int, numerical_customers: int) -> 'CustomerDemand':
+        """검증된 인스턴스를 재사용하는 팩토리 메서드 (같은 값이면 같은 객체 반환)"""
+        return cls(total_customers, ai_customers, numerical_customers)
+    
     def calculate_numerical_demand(self, market_share_percentage: Percentage) -> int:
         """수치적 고객 수요 계산"""
         return int(self.numerical_customers * market_share_percentage.as_ratio())
@@ -0,0 +1,71 @@
+"""
+데이터클래스 유틸리티
+
+불변 엔티티의 _replace(일부 필드만 바꾼 복사본 생성)를 빠르게 처리하는 도우미입니다.
+"""
+
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# 클래스별 (init 필드 값 추출기, 필드 이름 → 생성자 인자 위치) 캐시
+_REPLACE_PLANS: Dict[type, Tuple[Callable[[Any], tuple], Dict[str, int]]] = {}
+
+# 클래스별 비교 대상(compare=True) 필드 값 추출기 캐시
+_COMPARE_GETTERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _get_replace_plan(cls: type) -> Tuple[Callable[[Any], tuple], Dict[str, int]]:
+    """클래스의 복사 계획을 한 번만 계산하여 캐시"""
+    plan = _REPLACE_PLANS.get(cls)
+    if plan is None:
+        names = tuple(f.name for f in fields(cls) if f.init)
+        if len(names) == 1:
+            # attrgetter는 이름이 하나면 튜플이 아닌 값을 반환
+            single = attrgetter(names[0])
+            getter = lambda obj: (single(obj),)
+        else:
+            getter = attrgetter(*names)
+        plan = _REPLACE_PLANS[cls] = (getter, {name: index for index, name in enumerate(names)})
+    return plan
+
+
+def fast_replace(obj: T, changes: Dict[str, Any]) -> T:
+    """dataclasses.replace와 같은 결과를 내는 빠른 복사
+
+    필드 목록은 클래스별로 한 번만 계산하고 생성자를 위치 인자로 호출하므로
+    __post_init__ 검증과 init=False 필드 계산은 그대로 수행됩니다.
+
+    Raises:
+        TypeError: 생성자에서 받지 않는 필드 이름이 포함된 경우
+    """
+    cls = obj.__class__
+    getter, index = _get_replace_plan(cls)
+    values = list(getter(obj))
+    for name, value in changes.items():
+        position = index.get(name)
+        if position is None:
+            raise TypeError(f"{cls.__name__}에서 변경할 수 없는 필드입니다: {name}")
+        values[position] = value
+    return cls(*values)
+
+
+def entity_eq(obj: Any, other: Any) -> Any:
+    """id 필드를 가진 엔티티의 동등 비교 (자동 생성 __eq__와 같은 결과)
+
+    같은 객체이면 바로 True, id가 다르면 나머지 필드를 보지 않고 False를 반환하며
+    id가 같을 때만 비교 대상 필드 전체를 비교합니다.
+    """
+    if obj is other:
+        return True
+    cls = obj.__class__
+    if other.__class__ is not cls:
+        return NotImplemented
+    if obj.id != other.id:
+        return False
+    getter = _COMPARE_GETTERS.get(cls)
+    if getter is None:
+        getter = _COMPARE_GETTERS[cls] = attrgetter(*(f.name for f in fields(cls) if f.compare))
+    return getter(obj) == getter(other)
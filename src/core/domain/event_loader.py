@@ -5,15 +5,18 @@ CSV 파일에서 이벤트 데이터를 로드하기 위한 인터페이스입
 실제 구현은 infrastructure/adapter 계층에서 담당합니다.
 """
 
-from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Protocol
 from .event import EventTemplate
 
 
-class EventLoaderPort(ABC):
-    """이벤트 로더 포트 인터페이스"""
+class EventLoaderPort(Protocol):
+    """이벤트 로더 포트 인터페이스 (구조적 타입 - 구현체가 상속할 필요 없음)
+    
+    구현체는 첫 로드 후 ID → EventTemplate 색인을 메모리에 유지하여
+    get_event_template_by_id 호출마다 CSV를 다시 읽지 않아야 합니다.
+    (CachedEventLoader를 상속하면 이 규약을 그대로 따릅니다)
+    """
     
-    @abstractmethod
     def load_event_templates(self, csv_file_path: str) -> List[EventTemplate]:
         """CSV 파일에서 이벤트 템플릿들을 로드합니다.
         
@@ -27,9 +30,8 @@ class EventLoaderPort(ABC):
             FileNotFoundError: CSV 파일을 찾을 수 없을 때
             ValueError: CSV 데이터 형식이 잘못되었을 때
         """
-        pass
+        ...
     
-    @abstractmethod
     def get_event_template_by_id(self, csv_id: str) -> EventTemplate:
         """CSV ID로 특정 이벤트 템플릿을 조회합니다.
         
@@ -42,9 +44,8 @@ class EventLoaderPort(ABC):
         Raises:
             ValueError: 해당 ID의 이벤트를 찾을 수 없을 때
         """
-        pass
+        ...
     
-    @abstractmethod
     def validate_csv_format(self, csv_file_path: str) -> bool:
         """CSV 파일 형식이 올바른지 검증합니다.
         
@@ -54,4 +55,47 @@ class EventLoaderPort(ABC):
         Returns:
             검증 성공 여부
         """
-        pass 
\ No newline at end of file
+        ...
+
+
+class CachedEventLoader:
+    """ID 색인 캐시를 제공하는 이벤트 로더 기본 구현
+    
+    하위 클래스는 load_event_templates와 validate_csv_format을 구현하고
+    파싱한 템플릿을 _cache_templates로 등록하기만 하면 EventLoaderPort를 만족합니다.
+    """
+    
+    def __init__(self):
+        self._index: Dict[str, EventTemplate] = {}
+        self._loaded = False
+    
+    def _cache_templates(self, templates: List[EventTemplate]) -> None:
+        """파싱된 템플릿들을 ID 색인에 등록"""
+        index = self._index
+        for template in templates:
+            index[template.csv_id] = template
+        self._loaded = True
+    
+    def get_event_template_by_id(self, csv_id: str) -> EventTemplate:
+        """CSV ID로 특정 이벤트 템플릿을 조회합니다 (색인 조회)."""
+        if not self._loaded:
+            raise ValueError("먼저 load_event_templates()를 호출하여 CSV를 로드해야 합니다")
+        
+        template = self._index.get(csv_id)
+        if template is None:
+            raise ValueError(f"해당 ID의 이벤트를 찾을 수 없습니다: {csv_id}")
+        
+        return template
+    
+    def get_loaded_event_count(self) -> int:
+        """로드된 이벤트 개수를 반환"""
+        return len(self._index)
+    
+    def clear_cache(self):
+        """캐시를 초기화"""
+        self._index.clear()
+        self._loaded = False
+    
+    def get_all_event_ids(self) -> List[str]:
+        """로드된 모든 이벤트 ID 목록을 반환"""
+        return list(self._index.keys())
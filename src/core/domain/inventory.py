@@ -31,7 +31,7 @@ class Inventory:
         if not 0 <= self.quality <= 100:
             raise ValueError("재고 품질은 0-100 사이여야 합니다")
         
-        if self.purchase_price.is_negative():
+        if self.purchase_price.amount < 0:
             raise ValueError("구매 가격은 음수일 수 없습니다")
     
     def add(self, quantity: int, quality: int, purchase_price: Money) -> 'Inventory':
@@ -42,7 +42,7 @@ class Inventory:
         if not 0 <= quality <= 100:
             raise ValueError("품질은 0-100 사이여야 합니다")
         
-        if purchase_price.is_negative():
+        if purchase_price.amount < 0:
             raise ValueError("구매 가격은 음수일 수 없습니다")
         
         # 평균 품질 계산
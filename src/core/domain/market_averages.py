@@ -0,0 +1,18 @@
+"""
+시장 평균 도메인 모델
+
+제품 점수와 고객 평가의 기준이 되는 시장 평균값을 나타내는 불변 값 객체입니다.
+"""
+
+from dataclasses import dataclass
+
+from .value_objects import Money
+
+
+@dataclass(frozen=True, slots=True)
+class MarketAverages:
+    """시장 평균 데이터 (제품 점수/고객 평가용)"""
+    
+    average_price: Money
+    average_quality: float
+    average_awareness: float
@@ -5,15 +5,54 @@
 스탯, 피로도, 행복도, 자금 등의 상태를 관리합니다.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from .dataclass_utils import entity_eq, fast_replace
 from .value_objects import Money, Percentage, StatValue, Experience
 from common.enums.action_type import ActionType
+from constants import (
+    FATIGUE_WARN_RATIO,
+    FATIGUE_CRITICAL_RATIO,
+    FATIGUE_SHUTDOWN_RATIO,
+    FATIGUE_KNOCKOUT_RATIO,
+)
 
 
-@dataclass(frozen=True)
+# 스탯 이름별 값 조회기 (문자열 getattr 대신 C 구현 attrgetter 사용)
+_STAT_NAMES = ('cooking', 'management', 'service', 'tech', 'stamina')
+_STAT_GETTERS = {stat_name: attrgetter(stat_name) for stat_name in _STAT_NAMES}
+
+
+def _get_stat_getter(stat_name: str) -> attrgetter:
+    """스탯 이름 검증 후 조회기 반환"""
+    getter = _STAT_GETTERS.get(stat_name)
+    if getter is None:
+        raise ValueError(f"알 수 없는 스탯입니다: {stat_name}")
+    return getter
+
+
+@lru_cache(maxsize=256)
+def _fatigue_thresholds(stamina: int) -> tuple[float, float, float, float]:
+    """체력별 피로도 단계 기준값 (경고, 위험, 기절, 탈진)"""
+    return (
+        stamina * FATIGUE_WARN_RATIO,
+        stamina * FATIGUE_CRITICAL_RATIO,
+        stamina * FATIGUE_SHUTDOWN_RATIO,
+        stamina * FATIGUE_KNOCKOUT_RATIO,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _penalized_stat(stat: StatValue, penalty_ratio: float) -> StatValue:
+    """페널티가 적용된 스탯 (같은 스탯·비율 조합은 재사용)"""
+    return stat.apply_fatigue_penalty(penalty_ratio)
+
+
+@dataclass(frozen=True, slots=True)
 class Player:
     """플레이어 엔티티"""
     
@@ -38,6 +77,11 @@ class Player:
     # 진행 중인 연구들 (ID 참조)
     research_ids: tuple[UUID, ...]
     
+    # 실제 스탯 캐시 (첫 조회 시 계산, 상태가 바뀌면 새 Player가 만들어지므로 항상 유효)
+    _effective_stats: Optional['PlayerEffectiveStats'] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    
     def __post_init__(self):
         """생성 후 유효성 검사"""
         if not self.name.strip():
@@ -51,6 +95,19 @@ class Player:
         new_fatigue = self.fatigue + fatigue_delta
         return self._replace(fatigue=new_fatigue)
     
+    def apply_fatigue_raw(self, fatigue_delta: float) -> 'Player':
+        """피로도 변화량(숫자)을 바로 적용 후 새로운 Player 반환
+        
+        매 틱 호출되는 경로용으로, 결과를 0~100으로 제한한 뒤
+        Percentage 연산자와 재검증을 거치지 않고 생성합니다.
+        """
+        new_fatigue = self.fatigue.value + fatigue_delta
+        if new_fatigue > 100:
+            new_fatigue = 100
+        elif new_fatigue < 0:
+            new_fatigue = 0
+        return self._replace(fatigue=Percentage.unchecked(new_fatigue))
+    
     def apply_happiness(self, happiness_delta: Percentage) -> 'Player':
         """행복도 적용 후 새로운 Player 반환"""
         new_happiness = self.happiness + happiness_delta
@@ -58,7 +115,7 @@ class Player:
     
     def spend_money(self, amount: Money) -> 'Player':
         """자금 사용 후 새로운 Player 반환"""
-        if self.money < amount:
+        if self.money.amount < amount.amount:
             raise ValueError(f"자금이 부족합니다. 보유: {self.money.format_korean()}, 필요: {amount.format_korean()}")
         
         new_money = self.money - amount
@@ -71,10 +128,10 @@ class Player:
     
     def gain_stat_experience(self, stat_type: str, exp_amount: int) -> 'Player':
         """스탯 경험치 획득 후 새로운 Player 반환"""
-        current_stat = getattr(self, stat_type)
+        current_stat = _get_stat_getter(stat_type)(self)
         new_stat = current_stat.add_experience(exp_amount)
         
-        return self._replace(**{stat_type: new_stat})
+        return fast_replace(self, {stat_type: new_stat})
     
     def add_store(self, store_id: UUID) -> 'Player':
         """매장 추가 후 새로운 Player 반환"""
@@ -86,47 +143,57 @@ class Player:
         new_research_ids = self.research_ids + (research_id,)
         return self._replace(research_ids=new_research_ids)
     
+    def fatigue_level(self) -> int:
+        """피로도 단계 반환 (0: 정상, 1: 경고, 2: 위험, 3: 기절, 4: 탈진)"""
+        fatigue = self.fatigue.value
+        warn, critical, knockout, exhausted = _fatigue_thresholds(self.stamina.base_value)
+        # 기준값이 오름차순이므로 넘은 기준 개수가 곧 단계
+        return (fatigue >= warn) + (fatigue >= critical) + (fatigue >= knockout) + (fatigue >= exhausted)
+    
     def is_fatigued(self) -> bool:
         """피로도 경고 상태인지 확인 (체력의 50% 이상)"""
-        threshold = Percentage(self.stamina.base_value * 0.5)  # 50%
-        return self.fatigue >= threshold
+        return self.fatigue_level() >= 1
     
     def is_critically_fatigued(self) -> bool:
         """피로도 위험 상태인지 확인 (체력의 90% 이상)"""
-        threshold = Percentage(self.stamina.base_value * 0.9)  # 90%
-        return self.fatigue >= threshold
+        return self.fatigue_level() >= 2
     
     def is_knocked_out(self) -> bool:
         """피로도 기절 상태인지 확인 (체력의 100% 이상)"""
-        threshold = Percentage(self.stamina.base_value)  # 100%
-        return self.fatigue >= threshold
+        return self.fatigue_level() >= 3
     
     def is_completely_exhausted(self) -> bool:
         """완전 탈진 상태인지 확인 (체력의 200% 이상, 행동 불가)"""
-        threshold = Percentage(self.stamina.base_value * 2)  # 200%
-        return self.fatigue >= threshold
+        return self.fatigue_level() >= 4
     
     def get_effective_stats(self) -> 'PlayerEffectiveStats':
-        """피로도를 반영한 실제 스탯 반환"""
+        """피로도를 반영한 실제 스탯 반환 (인스턴스별로 한 번만 계산)"""
+        effective_stats = self._effective_stats
+        if effective_stats is not None:
+            return effective_stats
+        
         if self.is_knocked_out():
             # 체력 초과 시 모든 스탯 1/2
             penalty_ratio = 0.5
-            return PlayerEffectiveStats(
-                cooking=self.cooking.apply_fatigue_penalty(penalty_ratio),
-                management=self.management.apply_fatigue_penalty(penalty_ratio),
-                service=self.service.apply_fatigue_penalty(penalty_ratio),
-                tech=self.tech.apply_fatigue_penalty(penalty_ratio),
-                stamina=self.stamina.apply_fatigue_penalty(penalty_ratio),
+            effective_stats = PlayerEffectiveStats(
+                cooking=_penalized_stat(self.cooking, penalty_ratio),
+                management=_penalized_stat(self.management, penalty_ratio),
+                service=_penalized_stat(self.service, penalty_ratio),
+                tech=_penalized_stat(self.tech, penalty_ratio),
+                stamina=_penalized_stat(self.stamina, penalty_ratio),
             )
         else:
             # 정상 상태
-            return PlayerEffectiveStats(
+            effective_stats = PlayerEffectiveStats(
                 cooking=self.cooking,
                 management=self.management,
                 service=self.service,
                 tech=self.tech,
                 stamina=self.stamina,
             )
+        
+        object.__setattr__(self, '_effective_stats', effective_stats)
+        return effective_stats
     
     def calculate_happiness_change(self, profit: Money, fatigue_ratio: float) -> float:
         """행복도 변화량 계산 (f(x) = 50 ± A√(|x-50|/k) (A=50, k=1))"""
@@ -137,25 +204,30 @@ class Player:
             base_change -= 50 * ((abs(fatigue_ratio - 0.5) / 1) ** 0.5)
         
         # 수익에 따른 변화
-        if profit.is_positive():  # 흑자
+        if profit.amount > 0:  # 흑자
             base_change += 50 * ((abs(profit.amount / 1_000_000) / 1) ** 0.5)
-        elif profit.is_negative():  # 적자
+        elif profit.amount < 0:  # 적자
             base_change -= 50 * ((abs(profit.amount / 1_000_000) / 1) ** 0.5)
         
         return base_change
     
+    def __eq__(self, other: object) -> bool:
+        """같은 객체/다른 id는 바로 판정하고 id가 같을 때만 전체 필드 비교"""
+        return entity_eq(self, other)
+    
+    def __hash__(self) -> int:
+        """id 기반 해시 (같은 값이면 id도 같으므로 __eq__와 일관됨)"""
+        return hash(self.id)
+    
     def _replace(self, **changes) -> 'Player':
         """dataclass replace 메서드 래퍼"""
-        from dataclasses import replace
-        return replace(self, **changes)
+        return fast_replace(self, changes)
     
     @classmethod
     def create_new(cls, name: str, initial_money: int = 1000000) -> 'Player':
         """새 플레이어 생성 팩토리 메서드"""
-        from uuid import uuid4
-        
         # 기본 스탯들 생성 (초기값 + 경험치 0)
-        base_exp = Experience(0)
+        base_exp = Experience.ZERO
         cooking = StatValue(1, base_exp)  # 기본값 1로 시작
         management = StatValue(1, base_exp)
         service = StatValue(1, base_exp)
@@ -173,7 +245,7 @@ class Player:
             service=service,
             tech=tech,
             stamina=stamina,
-            fatigue=Percentage(0),
+            fatigue=Percentage.ZERO,
             happiness=Percentage(50),  # 중간 행복도로 시작
             money=Money(initial_money),
             store_ids=(first_store_id,),
@@ -181,7 +253,7 @@ class Player:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class PlayerEffectiveStats:
     """피로도를 반영한 플레이어의 실제 스탯"""
     
@@ -193,4 +265,4 @@ class PlayerEffectiveStats:
     
     def get_stat(self, stat_name: str) -> StatValue:
         """스탯 이름으로 스탯 값 조회"""
-        return getattr(self, stat_name) 
\ No newline at end of file
+        return _get_stat_getter(stat_name)(self) 
\ No newline at end of file
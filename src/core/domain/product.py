@@ -5,13 +5,17 @@
 제품의 품질은 [요리]스탯과 [제품]의 [연구도], 재료의 [품질]의 평균으로 계산됩니다.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
+from operator import attrgetter
 from uuid import UUID
-from typing import List
+from typing import Sequence
 
+from .dataclass_utils import entity_eq, fast_replace
 from .value_objects import Money, Percentage, Progress
 from .inventory import Inventory
+from .market_averages import MarketAverages
+from constants import AWARENESS_GAIN_PER_SALE, AWARENESS_DAILY_DECAY
 
 
 class ProductCategory(Enum):
@@ -24,7 +28,12 @@ class ProductCategory(Enum):
     SIDE_DISH = auto()  # 사이드 메뉴
 
 
-@dataclass(frozen=True)
+# 재료 속성 추출기 (sum(map(...))으로 제너레이터 없이 합산)
+_INGREDIENT_PRICE = attrgetter('purchase_price.amount')
+_INGREDIENT_QUALITY = attrgetter('quality')
+
+
+@dataclass(frozen=True, slots=True)
 class Product:
     """제품 엔티티"""
     
@@ -33,15 +42,20 @@ class Product:
     recipe_id: UUID
     selling_price: Money
     research_progress: Progress  # 연구도 (0~100)
-    ingredients: List[Inventory]  # 재료 목록
+    ingredients: tuple[Inventory, ...]  # 재료 목록 (리스트로 전달하면 튜플로 변환)
     awareness: int  # 인지도
     
+    # 재료에서 파생되는 값 캐시 (생성 시 한 번만 계산)
+    _cost: Money = field(init=False, repr=False, compare=False)
+    _avg_ingredient_quality: int = field(init=False, repr=False, compare=False)
+    _quality_at_zero_cook: int = field(init=False, repr=False, compare=False)  # calculate_quality(0)
+    
     def __post_init__(self):
         """생성 후 유효성 검사"""
         if not self.name.strip():
             raise ValueError("제품 이름은 비어있을 수 없습니다")
         
-        if self.selling_price.is_negative():
+        if self.selling_price.amount < 0:
             raise ValueError("판매 가격은 음수일 수 없습니다")
         
         if not self.ingredients:
@@ -49,23 +63,29 @@ class Product:
         
         if self.awareness < 0:
             raise ValueError("인지도는 음수일 수 없습니다")
+        
+        # 불변·해시 가능하도록 재료 목록은 튜플로 보관
+        ingredients = self.ingredients
+        if type(ingredients) is not tuple:
+            ingredients = tuple(ingredients)
+            object.__setattr__(self, 'ingredients', ingredients)
+        object.__setattr__(self, '_cost', Money.sum_amounts(map(_INGREDIENT_PRICE, ingredients)))
+        object.__setattr__(
+            self, '_avg_ingredient_quality', sum(map(_INGREDIENT_QUALITY, ingredients)) // len(ingredients)
+        )
+        object.__setattr__(
+            self, '_quality_at_zero_cook', (self.research_progress.value + self._avg_ingredient_quality) // 3
+        )
     
     def calculate_quality(self, cooking_stat: int) -> int:
         """제품 품질 계산 ([요리]스탯과 [제품]의 [연구도], 재료의 [품질]의 평균)"""
-        # 재료 품질 평균 계산
-        total_ingredient_quality = sum(ingredient.quality for ingredient in self.ingredients)
-        avg_ingredient_quality = total_ingredient_quality // len(self.ingredients)
-        
-        # 전체 품질 평균 계산
-        total_quality = cooking_stat + self.research_progress.value + avg_ingredient_quality
+        # 재료 품질 평균은 생성 시 계산된 값 사용
+        total_quality = cooking_stat + self.research_progress.value + self._avg_ingredient_quality
         return total_quality // 3
     
     def calculate_cost(self) -> Money:
-        """제품 원가 계산 (재료비 합계)"""
-        total_cost = Money(0)
-        for ingredient in self.ingredients:
-            total_cost += ingredient.purchase_price
-        return total_cost
+        """제품 원가 계산 (재료비 합계, 생성 시 계산된 값)"""
+        return self._cost
     
     def calculate_profit_margin(self) -> float:
         """수익률 계산 ((판매가 - 원가) / 원가)"""
@@ -80,19 +100,28 @@ class Product:
     
     def update_selling_price(self, price: Money) -> 'Product':
         """판매 가격 업데이트"""
-        if price.is_negative():
+        if price.amount < 0:
             raise ValueError("판매 가격은 음수일 수 없습니다")
         return self._replace(selling_price=price)
     
     def increase_awareness_by_sale(self) -> 'Product':
         """판매로 인한 인지도 증가 (3 증가)"""
-        return self._replace(awareness=self.awareness + 3)
+        return self._replace(awareness=self.awareness + AWARENESS_GAIN_PER_SALE)
     
     def decrease_awareness_daily(self) -> 'Product':
         """매일 인지도 감소 (1 감소)"""
-        new_awareness = max(0, self.awareness - 1)
+        new_awareness = max(0, self.awareness - AWARENESS_DAILY_DECAY)
         return self._replace(awareness=new_awareness)
     
+    def apply_daily_awareness(self, sales_count: int) -> 'Product':
+        """하루치 인지도 변화를 한 번에 적용 (판매 증가 후 일일 감소)
+        
+        increase_awareness_by_sale을 sales_count번 호출한 뒤
+        decrease_awareness_daily를 호출한 것과 같지만 복사는 한 번만 합니다.
+        """
+        new_awareness = self.awareness + sales_count * AWARENESS_GAIN_PER_SALE - AWARENESS_DAILY_DECAY
+        return self._replace(awareness=max(0, new_awareness))
+    
     def increase_awareness_by_market_share(self, market_share_percentage: float) -> 'Product':
         """시장 점유율에 따른 인지도 증가 (점유율 * 10)"""
         increase = int(market_share_percentage * 10)
@@ -103,7 +132,7 @@ class Product:
         - 경쟁자들의 광고비용보다 높으면 매일 현재 광고비만큼 증가
         - 낮으면 매일 1씩 증가
         """
-        if my_ad_cost > competitor_max_ad_cost:
+        if my_ad_cost.amount > competitor_max_ad_cost.amount:
             increase = my_ad_cost.amount // 10000  # 1만원당 1씩 증가
         else:
             increase = 1
@@ -119,7 +148,7 @@ class Product:
         """품질 점수 계산 (시장 평균 대비)"""
         if market_average_quality == 0:
             return 100.0
-        return (self.calculate_quality(0) / market_average_quality) * 100  # 요리 스탯은 별도로 전달
+        return (self._quality_at_zero_cook / market_average_quality) * 100  # 요리 스탯은 별도로 전달
     
     def calculate_awareness_score(self, market_average_awareness: float) -> float:
         """인지도 점수 계산 (시장 평균 대비)"""
@@ -141,18 +170,43 @@ class Product:
     
     def get_display_info(self) -> str:
         """제품 정보 문자열 반환"""
-        return f"{self.name} - {self.selling_price.format_korean()} (품질: {self.calculate_quality(0)}, 인지도: {self.awareness})"
+        return f"{self.name} - {self.selling_price.format_korean()} (품질: {self._quality_at_zero_cook}, 인지도: {self.awareness})"
+    
+    def __eq__(self, other: object) -> bool:
+        """같은 객체/다른 id는 바로 판정하고 id가 같을 때만 전체 필드 비교"""
+        return entity_eq(self, other)
+    
+    def __hash__(self) -> int:
+        """id 기반 해시 (같은 값이면 id도 같으므로 __eq__와 일관됨)"""
+        return hash(self.id)
     
     def _replace(self, **changes) -> 'Product':
         """dataclass replace 메서드 래퍼"""
-        from dataclasses import replace
-        return replace(self, **changes)
+        return fast_replace(self, changes) 
 
 
-@dataclass(frozen=True)
-class MarketAverages:
-    """시장 평균 데이터"""
-    
-    average_price: Money
-    average_quality: float
-    average_awareness: float 
\ No newline at end of file
+def apply_advertising_awareness(
+    products: Sequence[Product],
+    my_ad_costs: Sequence[Money],
+    competitor_max_ad_cost: Money
+) -> list[Product]:
+    """여러 제품에 광고 인지도 증가를 한 번에 적용 (제품 순서 유지)
+    
+    제품마다 increase_awareness_by_advertising을 호출한 것과 같은 결과이며,
+    경쟁자 최대 광고비는 한 번만 꺼내 쓰고 복사는 제품당 한 번만 합니다.
+    
+    Args:
+        products: 대상 제품 목록
+        my_ad_costs: 제품별 자사 광고비 (products와 같은 순서)
+        competitor_max_ad_cost: 경쟁자들의 최대 광고비
+    """
+    if len(products) != len(my_ad_costs):
+        raise ValueError("광고비 개수가 제품 수와 일치하지 않습니다")
+    
+    competitor_max = competitor_max_ad_cost.amount
+    updated = []
+    for product, my_ad_cost in zip(products, my_ad_costs):
+        my_amount = my_ad_cost.amount
+        increase = my_amount // 10000 if my_amount > competitor_max else 1  # 1만원당 1씩 증가
+        updated.append(fast_replace(product, {'awareness': product.awareness + increase}))
+    return updated
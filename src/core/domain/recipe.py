@@ -5,14 +5,15 @@
 연구를 통해 개발되고 신제품 출시를 통해 제품으로 전환됩니다.
 """
 
-from dataclasses import dataclass
-from uuid import UUID
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
 
+from .dataclass_utils import entity_eq, fast_replace
 from .value_objects import Progress
 from .product import ProductCategory
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Recipe:
     """레시피 엔티티"""
     
@@ -28,6 +29,9 @@ class Recipe:
     # 획득 방법 메타데이터
     acquired_from_event: bool = False  # 이벤트로 획득했는지
     
+    # 연구 난이도 보정치 (1 / 난이도, 생성 시 한 번만 계산)
+    _difficulty_modifier: float = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """생성 후 유효성 검사"""
         if not self.name.strip():
@@ -38,6 +42,8 @@ class Recipe:
         
         if self.difficulty <= 0:
             raise ValueError("난이도는 0보다 커야 합니다")
+        
+        object.__setattr__(self, '_difficulty_modifier', 1.0 / self.difficulty)
     
     def advance_research(self, progress_amount: int) -> 'Recipe':
         """연구 진행 후 새로운 Recipe 반환"""
@@ -65,12 +71,12 @@ class Recipe:
         
         # 최종 품질 = 기본 품질 + 모든 보너스의 합
         final_quality = self.base_quality + cooking_bonus + research_bonus + ingredient_bonus
-        return max(0, final_quality)
+        return final_quality if final_quality > 0 else 0
     
     def get_research_difficulty_modifier(self) -> float:
         """연구 난이도 보정치 반환 (높을수록 진행 속도 감소)"""
         # 난이도가 높을수록 진행 속도가 느려짐
-        return 1.0 / self.difficulty
+        return self._difficulty_modifier
     
     def get_display_info(self) -> str:
         """레시피 정보 문자열 반환"""
@@ -79,10 +85,28 @@ class Recipe:
         
         return f"{self.name} - 연구: {status}, 난이도: {self.difficulty}{source}"
     
+    def __eq__(self, other: object) -> bool:
+        """같은 객체/다른 id는 바로 판정하고 id가 같을 때만 전체 필드 비교"""
+        return entity_eq(self, other)
+    
+    def __hash__(self) -> int:
+        """id 기반 해시 (같은 값이면 id도 같으므로 __eq__와 일관됨)"""
+        return hash(self.id)
+    
     def _replace(self, **changes) -> 'Recipe':
         """dataclass replace 메서드 래퍼"""
-        from dataclasses import replace
-        return replace(self, **changes)
+        return fast_replace(self, changes)
+
+
+# 기본 후라이드 치킨 레시피 원형 (새 게임마다 ID만 바꿔 복사)
+_FRIED_CHICKEN_PROTOTYPE = Recipe(
+    id=uuid4(),
+    name="후라이드 치킨",
+    category=ProductCategory.FRIED_CHICKEN,
+    base_quality=30,
+    research_level=Progress(100),  # 기본 레시피는 완료 상태
+    difficulty=1,  # 가장 낮은 난이도
+)
 
 
 @dataclass(frozen=True)
@@ -91,14 +115,5 @@ class DefaultRecipes:
     
     @staticmethod
     def create_fried_chicken_recipe() -> Recipe:
-        """기본 후라이드 치킨 레시피 생성"""
-        from uuid import uuid4
-        
-        return Recipe(
-            id=uuid4(),
-            name="후라이드 치킨",
-            category=ProductCategory.FRIED_CHICKEN,
-            base_quality=30,
-            research_level=Progress(100),  # 기본 레시피는 완료 상태
-            difficulty=1,  # 가장 낮은 난이도
-        ) 
\ No newline at end of file
+        """기본 후라이드 치킨 레시피 생성 (원형에 새 ID 부여)"""
+        return _FRIED_CHICKEN_PROTOTYPE._replace(id=uuid4())
@@ -8,11 +8,12 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from .dataclass_utils import fast_replace
 from .value_objects import Progress
 from common.enums.research_type import ResearchType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Research:
     """연구 엔티티"""
     
@@ -80,11 +81,10 @@ class Research:
     
     def _replace(self, **changes) -> 'Research':
         """dataclass replace 메서드 래퍼"""
-        from dataclasses import replace
-        return replace(self, **changes)
+        return fast_replace(self, changes)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResearchTemplate:
     """연구 템플릿 (게임 초기화용)"""
     
@@ -102,66 +102,70 @@ class ResearchTemplate:
             research_type=self.research_type,
             name=self.name,
             description=self.description,
-            progress=Progress(0),  # 0%로 시작
+            progress=Progress.ZERO,  # 0%로 시작
             difficulty=self.difficulty,
             required_stat=self.required_stat,
             min_stat_required=self.min_stat_required,
         )
 
 
+# 기본 연구 템플릿 (불변 객체이므로 모듈 로드 시 한 번만 생성)
+_DEFAULT_TEMPLATES: tuple[ResearchTemplate, ...] = (
+    # 요리 연구
+    ResearchTemplate(
+        research_type=ResearchType.RECIPE,
+        name="양념 치킨 레시피",
+        description="매콤달콤한 양념 치킨 레시피를 개발합니다.",
+        difficulty=2,
+        required_stat="cooking",
+        min_stat_required=20,
+    ),
+    ResearchTemplate(
+        research_type=ResearchType.RECIPE,
+        name="크리스피 치킨 레시피",
+        description="바삭한 크리스피 치킨 레시피를 개발합니다.",
+        difficulty=3,
+        required_stat="cooking",
+        min_stat_required=30,
+    ),
+    
+    # 마케팅 연구
+    ResearchTemplate(
+        research_type=ResearchType.ADVERTISING,
+        name="SNS 마케팅",
+        description="소셜미디어를 활용한 마케팅 기법을 연구합니다.",
+        difficulty=2,
+        required_stat="management",
+        min_stat_required=25,
+    ),
+    
+    # 경영 연구
+    ResearchTemplate(
+        research_type=ResearchType.MANAGEMENT,
+        name="효율적인 매장 운영",
+        description="매장 운영의 효율성을 높이는 방법을 연구합니다.",
+        difficulty=2,
+        required_stat="management",
+        min_stat_required=20,
+    ),
+    
+    # 기술 연구
+    ResearchTemplate(
+        research_type=ResearchType.MANAGEMENT,
+        name="자동 조리 시스템",
+        description="조리 과정을 자동화하는 시스템을 개발합니다.",
+        difficulty=4,
+        required_stat="tech",
+        min_stat_required=40,
+    ),
+)
+
+
 @dataclass(frozen=True)
 class DefaultResearchTemplates:
     """기본 연구 템플릿 정보"""
     
     @staticmethod
     def get_all_templates() -> list[ResearchTemplate]:
-        """모든 기본 연구 템플릿 반환"""
-        return [
-            # 요리 연구
-            ResearchTemplate(
-                research_type=ResearchType.COOKING,
-                name="양념 치킨 레시피",
-                description="매콤달콤한 양념 치킨 레시피를 개발합니다.",
-                difficulty=2,
-                required_stat="cooking",
-                min_stat_required=20,
-            ),
-            ResearchTemplate(
-                research_type=ResearchType.COOKING,
-                name="크리스피 치킨 레시피",
-                description="바삭한 크리스피 치킨 레시피를 개발합니다.",
-                difficulty=3,
-                required_stat="cooking",
-                min_stat_required=30,
-            ),
-            
-            # 마케팅 연구
-            ResearchTemplate(
-                research_type=ResearchType.MARKETING,
-                name="SNS 마케팅",
-                description="소셜미디어를 활용한 마케팅 기법을 연구합니다.",
-                difficulty=2,
-                required_stat="management",
-                min_stat_required=25,
-            ),
-            
-            # 경영 연구
-            ResearchTemplate(
-                research_type=ResearchType.MANAGEMENT,
-                name="효율적인 매장 운영",
-                description="매장 운영의 효율성을 높이는 방법을 연구합니다.",
-                difficulty=2,
-                required_stat="management",
-                min_stat_required=20,
-            ),
-            
-            # 기술 연구
-            ResearchTemplate(
-                research_type=ResearchType.TECHNOLOGY,
-                name="자동 조리 시스템",
-                description="조리 과정을 자동화하는 시스템을 개발합니다.",
-                difficulty=4,
-                required_stat="tech",
-                min_stat_required=40,
-            ),
-        ] 
\ No newline at end of file
+        """모든 기본 연구 템플릿 반환 (모듈 상수 템플릿의 새 리스트)"""
+        return list(_DEFAULT_TEMPLATES)
@@ -5,7 +5,7 @@
 제품, 재고, 직원 등을 관리합니다.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 from uuid import UUID
 from datetime import date
@@ -37,6 +37,9 @@ class Store:
     # 점장 (2번째 이후 매장용, 선택적)
     manager_id: Optional[UUID] = None
     
+    # 일일 임대료 (월 임대료에서 생성 시 한 번만 계산)
+    daily_rent: Money = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """생성 후 유효성 검사"""
         if not self.name.strip():
@@ -44,6 +47,8 @@ class Store:
         
         if self.monthly_rent.amount <= 0:
             raise ValueError("임대료는 0원보다 커야 합니다")
+        
+        object.__setattr__(self, 'daily_rent', self.monthly_rent / 30)
     
     def add_product(self, product_id: UUID) -> 'Store':
         """제품 추가 후 새로운 Store 반환"""
@@ -109,8 +114,8 @@ class Store:
         return self.is_first_store or self.has_manager()
     
     def get_daily_rent(self) -> Money:
-        """일일 임대료 계산"""
-        return self.monthly_rent / 30
+        """일일 임대료 조회"""
+        return self.daily_rent
     
     def has_products(self) -> bool:
         """판매할 제품이 있는지 확인"""
@@ -6,24 +6,56 @@
 """
 
 from dataclasses import dataclass
-from enum import Enum, auto
-from datetime import date
-from typing import Optional
+from enum import IntEnum
+from functools import lru_cache
+from datetime import date, timedelta
+from typing import Optional, final
 from uuid import UUID
 
+from .dataclass_utils import fast_replace
 
-class GamePhase(Enum):
-    """게임 페이즈"""
-    
-    PLAYER_ACTION = auto()  # 1. 플레이어 행동
-    AI_ACTION = auto()  # 2. AI 행동 (경쟁자)
-    EVENT = auto()  # 3. 이벤트
-    SALES = auto()  # 4. 판매
-    SETTLEMENT = auto()  # 5. 정산
-    CLEANUP = auto()  # 6. 마무리
+
+class GamePhase(IntEnum):
+    """게임 페이즈 (값은 진행 순서 인덱스)"""
+    
+    PLAYER_ACTION = 0  # 1. 플레이어 행동
+    AI_ACTION = 1  # 2. AI 행동 (경쟁자)
+    EVENT = 2  # 3. 이벤트
+    SALES = 3  # 4. 판매
+    SETTLEMENT = 4  # 5. 정산
+    CLEANUP = 5  # 6. 마무리
+
+
+# 페이즈 진행 순서 (호출마다 enum을 순회하지 않도록 모듈 상수로 유지, 위치는 페이즈 값과 같음)
+_PHASE_ORDER = tuple(GamePhase)
+_PHASE_COUNT = len(_PHASE_ORDER)
+
+# 페이즈별 다음 페이즈 (마지막 페이즈는 None - 턴 완료)
+_NEXT_PHASE: dict[GamePhase, Optional[GamePhase]] = {
+    phase: _PHASE_ORDER[index + 1] if index + 1 < _PHASE_COUNT else None
+    for index, phase in enumerate(_PHASE_ORDER)
+}
+
+# 페이즈별 표시 이름 (GamePhase 값 순서)
+_PHASE_NAMES = (
+    "플레이어 행동",
+    "AI 행동",
+    "이벤트",
+    "판매",
+    "정산",
+    "마무리",
+)
 
 
-@dataclass(frozen=True)
+def get_phase_name(phase: GamePhase) -> str:
+    """페이즈 표시 이름 반환 (GamePhase가 아니면 "알 수 없음")"""
+    if isinstance(phase, GamePhase):
+        return _PHASE_NAMES[phase]
+    return "알 수 없음"
+
+
+@final
+@dataclass(frozen=True, slots=True)
 class Turn:
     """턴 엔티티"""
     
@@ -45,15 +77,13 @@ class Turn:
         if self.is_complete:
             raise ValueError("이미 완료된 턴입니다")
         
-        phase_order = list(GamePhase)
-        current_index = phase_order.index(self.current_phase)
+        next_phase = _NEXT_PHASE[self.current_phase]
         
-        if current_index >= len(phase_order) - 1:
+        if next_phase is None:
             # 마지막 페이즈에서 턴 완료
             return self._replace(is_complete=True)
         else:
             # 다음 페이즈로 진행
-            next_phase = phase_order[current_index + 1]
             return self._replace(current_phase=next_phase)
     
     def set_active_event(self, event_id: UUID) -> 'Turn':
@@ -66,27 +96,27 @@ class Turn:
     
     def is_player_action_phase(self) -> bool:
         """플레이어 행동 페이즈인지 확인"""
-        return self.current_phase == GamePhase.PLAYER_ACTION
+        return self.current_phase is GamePhase.PLAYER_ACTION
     
     def is_ai_action_phase(self) -> bool:
         """AI 행동 페이즈인지 확인"""
-        return self.current_phase == GamePhase.AI_ACTION
+        return self.current_phase is GamePhase.AI_ACTION
     
     def is_event_phase(self) -> bool:
         """이벤트 페이즈인지 확인"""
-        return self.current_phase == GamePhase.EVENT
+        return self.current_phase is GamePhase.EVENT
     
     def is_sales_phase(self) -> bool:
         """판매 페이즈인지 확인"""
-        return self.current_phase == GamePhase.SALES
+        return self.current_phase is GamePhase.SALES
     
     def is_settlement_phase(self) -> bool:
         """정산 페이즈인지 확인"""
-        return self.current_phase == GamePhase.SETTLEMENT
+        return self.current_phase is GamePhase.SETTLEMENT
     
     def is_cleanup_phase(self) -> bool:
         """마무리 페이즈인지 확인"""
-        return self.current_phase == GamePhase.CLEANUP
+        return self.current_phase is GamePhase.CLEANUP
     
     def has_active_event(self) -> bool:
         """활성 이벤트가 있는지 확인"""
@@ -94,38 +124,27 @@ class Turn:
     
     def get_phase_name(self) -> str:
         """현재 페이즈 이름 반환"""
-        phase_names = {
-            GamePhase.PLAYER_ACTION: "플레이어 행동",
-            GamePhase.AI_ACTION: "AI 행동",
-            GamePhase.EVENT: "이벤트",
-            GamePhase.SALES: "판매",
-            GamePhase.SETTLEMENT: "정산",
-            GamePhase.CLEANUP: "마무리",
-        }
-        return phase_names.get(self.current_phase, "알 수 없음")
+        return get_phase_name(self.current_phase)
     
     def get_progress_percentage(self) -> float:
         """턴 진행률 계산 (0~100%)"""
         if self.is_complete:
             return 100.0
         
-        phase_order = list(GamePhase)
-        current_index = phase_order.index(self.current_phase)
-        return (current_index / len(phase_order)) * 100
+        return (self.current_phase / _PHASE_COUNT) * 100
     
     def get_next_turn(self) -> 'Turn':
         """다음 턴 생성"""
         if not self.is_complete:
             raise ValueError("현재 턴이 완료되지 않았습니다")
         
-        from datetime import timedelta
         next_date = self.game_date + timedelta(days=1)
         
+        # 첫 페이즈부터 시작
         return Turn(
             turn_number=self.turn_number + 1,
             game_date=next_date,
-            current_phase=GamePhase.PLAYER_ACTION,  # 첫 페이즈부터 시작
-            is_complete=False,
+            current_phase=GamePhase.PLAYER_ACTION,
         )
     
     def get_display_info(self) -> str:
@@ -135,23 +154,30 @@ class Turn:
     
     def _replace(self, **changes) -> 'Turn':
         """dataclass replace 메서드 래퍼"""
-        from dataclasses import replace
-        return replace(self, **changes)
+        return fast_replace(self, changes)
 
 
-@dataclass(frozen=True)
+@final
+@dataclass(frozen=True, slots=True)
 class TurnResult:
     """턴 결과 데이터"""
     
     turn: Turn
     
     # 페이즈별 결과
-    player_actions: list[str]  # 플레이어가 수행한 행동들
-    ai_actions: list[str]  # AI가 수행한 행동들
+    player_actions: tuple[str, ...]  # 플레이어가 수행한 행동들 (리스트로 전달하면 튜플로 변환)
+    ai_actions: tuple[str, ...]  # AI가 수행한 행동들 (리스트로 전달하면 튜플로 변환)
     event_result: Optional[str]  # 이벤트 결과
     sales_result: dict  # 판매 결과 (매출, 고객 수 등)
     settlement_result: dict  # 정산 결과 (수익, 비용 등)
     
+    def __post_init__(self):
+        """행동 목록은 불변 튜플로 보관"""
+        if type(self.player_actions) is not tuple:
+            object.__setattr__(self, 'player_actions', tuple(self.player_actions))
+        if type(self.ai_actions) is not tuple:
+            object.__setattr__(self, 'ai_actions', tuple(self.ai_actions))
+    
     def get_total_revenue(self) -> int:
         """총 매출 반환"""
         return self.sales_result.get("total_revenue", 0)
@@ -169,7 +195,14 @@ class TurnResult:
         return self.get_net_profit() > 0
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=4096)
+def _is_month_end(day: date) -> bool:
+    """월말 여부 (다음 날의 월이 바뀌는지, 날짜별로 캐시)"""
+    return (day + timedelta(days=1)).month != day.month
+
+
+@final
+@dataclass(frozen=True, slots=True)
 class GameCalendar:
     """게임 달력 (턴 관리 도우미)"""
     
@@ -191,8 +224,7 @@ class GameCalendar:
     
     def is_month_end(self) -> bool:
         """현재 날짜가 월말인지 확인"""
-        next_day = self.current_turn.game_date + timedelta(days=1)
-        return next_day.month != self.current_turn.game_date.month
+        return _is_month_end(self.current_turn.game_date)
     
     def advance_turn(self) -> 'GameCalendar':
         """다음 턴으로 진행"""
@@ -201,5 +233,4 @@ class GameCalendar:
     
     def _replace(self, **changes) -> 'GameCalendar':
         """dataclass replace 메서드 래퍼"""
-        from dataclasses import replace
-        return replace(self, **changes) 
\ No newline at end of file
+        return fast_replace(self, changes)
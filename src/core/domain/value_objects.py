@@ -6,53 +6,76 @@
 """
 
 from dataclasses import dataclass
-from typing import Union
+from functools import lru_cache
+from typing import ClassVar, Iterable, Sequence, Union, final
 import math
 
 
-@dataclass(frozen=True)
+@final
+@dataclass(frozen=True, slots=True)
 class Money:
     """원화 단위 값 객체"""
     
+    ZERO: ClassVar['Money']  # 0원 공용 인스턴스 (클래스 정의 후 설정)
+    
     amount: int
     
     def __post_init__(self):
         if self.amount < 0:
             raise ValueError(f"금액은 0원 이하일 수 없습니다: {self.amount}")
     
+    @classmethod
+    @lru_cache(maxsize=4096, typed=True)
+    def of(cls, amount: int) -> 'Money':
+        """자주 쓰는 금액은 같은 인스턴스를 재사용하는 팩토리 메서드 (5와 5.0은 따로 캐시)"""
+        return cls(amount)
+    
+    @classmethod
+    def sum_amounts(cls, amounts: Iterable[int]) -> 'Money':
+        """원화 금액(정수)들을 합산해 Money 하나로 반환 (중간 Money 생성 없음)"""
+        total = sum(amounts)
+        return cls(total) if total else cls.ZERO
+    
+    # 연산자는 정확한 타입 비교(__class__ is Money)로 isinstance 호출을 피함
     def __add__(self, other: Union['Money', int]) -> 'Money':
-        if isinstance(other, Money):
+        if other.__class__ is Money:
             return Money(self.amount + other.amount)
         return Money(self.amount + other)
     
     def __sub__(self, other: Union['Money', int]) -> 'Money':
-        if isinstance(other, Money):
-            return Money(self.amount - other.amount)
-        return Money(self.amount - other)
+        if other.__class__ is Money:
+            amount = self.amount - other.amount
+        else:
+            amount = self.amount - other
+        return Money(amount) if amount else Money.ZERO
     
     def __mul__(self, multiplier: Union[int, float]) -> 'Money':
-        return Money(int(self.amount * multiplier))
+        if multiplier.__class__ is int:
+            amount = self.amount * multiplier
+        else:
+            amount = int(self.amount * multiplier)
+        return Money(amount) if amount else Money.ZERO
     
     def __truediv__(self, divisor: Union[int, float]) -> 'Money':
         return Money(int(self.amount / divisor))
     
     def __lt__(self, other: Union['Money', int]) -> bool:
-        if isinstance(other, Money):
+        if other.__class__ is Money:
             return self.amount < other.amount
         return self.amount < other
     
     def __le__(self, other: Union['Money', int]) -> bool:
-        if isinstance(other, Money):
+        if other.__class__ is Money:
             return self.amount <= other.amount
         return self.amount <= other
     
     def __gt__(self, other: Union['Money', int]) -> bool:
-        if isinstance(other, Money):
+        if other.__class__ is Money:
             return self.amount > other.amount
         return self.amount > other
     
     def __ge__(self, other: Union['Money', int]) -> bool:
-        if isinstance(other, Money):
+        if other.__class__ is Money:
             return self.amount >= other.amount
         return self.amount >= other
     
@@ -65,16 +88,51 @@ class Money:
         return f"₩{self.amount:,}"
 
 
-@dataclass(frozen=True)
+Money.ZERO = Money.of(0)
+
+
+@final
+@dataclass(frozen=True, slots=True, order=True)
 class Percentage:
     """퍼센트 값 객체 (0~100)"""
     
+    ZERO: ClassVar['Percentage']  # 0% 공용 인스턴스 (클래스 정의 후 설정)
+    
     value: float
     
     def __post_init__(self):
         if not 0 <= self.value <= 100:
             raise ValueError(f"퍼센트 값은 0~100 사이여야 합니다: {self.value}")
     
+    @classmethod
+    @lru_cache(maxsize=4096, typed=True)
+    def of(cls, value: float) -> 'Percentage':
+        """자주 쓰는 퍼센트는 같은 인스턴스를 재사용하는 팩토리 메서드"""
+        return cls(value)
+    
+    @classmethod
+    def unchecked(cls, value: float) -> 'Percentage':
+        """범위 검증 없이 생성 (호출자가 0~100 범위를 보장하는 경우에만 사용)"""
+        percentage = object.__new__(cls)
+        object.__setattr__(percentage, 'value', value)
+        return percentage
+    
+    @classmethod
+    def mean(cls, values: Iterable[float]) -> 'Percentage':
+        """퍼센트 값(숫자)들의 평균을 Percentage 하나로 반환
+        
+        Raises:
+            ValueError: 값이 하나도 없는 경우
+        """
+        total = 0.0
+        count = 0
+        for value in values:
+            total += value
+            count += 1
+        if count == 0:
+            raise ValueError("평균을 계산할 퍼센트 값이 없습니다")
+        return cls(total / count)
+    
     def __add__(self, other: Union['Percentage', float]) -> 'Percentage':
         if isinstance(other, Percentage):
             return Percentage(min(100, self.value + other.value))
@@ -82,8 +140,12 @@ class Percentage:
     
     def __sub__(self, other: Union['Percentage', float]) -> 'Percentage':
         if isinstance(other, Percentage):
-            return Percentage(max(0, self.value - other.value))
-        return Percentage(max(0, self.value - other))
+            other = other.value
+        value = self.value - other
+        if value <= 0:
+            return Percentage.ZERO
+        # 0 초과 100 이하로 확인된 값은 재검증 없이 생성 (음수를 빼 100을 넘으면 기존대로 검증 오류)
+        return Percentage.unchecked(value) if value <= 100 else Percentage(value)
     
     def __mul__(self, multiplier: Union[int, float]) -> 'Percentage':
         return Percentage(min(100, self.value * multiplier))
@@ -101,25 +163,38 @@ class Percentage:
         return f"{self.value:.1f}%"
 
 
-@dataclass(frozen=True)
+Percentage.ZERO = Percentage.of(0)
+
+
+@final
+@dataclass(frozen=True, slots=True, order=True)
 class Hours:
     """시간 값 객체 (0~24)"""
     
+    ZERO: ClassVar['Hours']  # 0시간 공용 인스턴스 (클래스 정의 후 설정)
+    
     value: int
     
     def __post_init__(self):
         if not 0 <= self.value <= 24:
             raise ValueError(f"시간 값은 0~24 사이여야 합니다: {self.value}")
     
+    @classmethod
+    @lru_cache(maxsize=64, typed=True)
+    def of(cls, value: int) -> 'Hours':
+        """같은 시간 값은 같은 인스턴스를 재사용하는 팩토리 메서드 (0~24)"""
+        return cls(value)
+    
     def __add__(self, other: Union['Hours', int]) -> 'Hours':
         if isinstance(other, Hours):
-            return Hours(min(24, self.value + other.value))
-        return Hours(min(24, self.value + other))
+            return Hours.of(min(24, self.value + other.value))
+        return Hours.of(min(24, self.value + other))
     
     def __sub__(self, other: Union['Hours', int]) -> 'Hours':
         if isinstance(other, Hours):
-            return Hours(max(0, self.value - other.value))
-        return Hours(max(0, self.value - other))
+            other = other.value
+        value = self.value - other
+        return Hours.of(value) if value > 0 else Hours.ZERO
     
     def is_exhausted(self) -> bool:
         """시간이 모두 소진되었는지 확인"""
@@ -132,20 +207,32 @@ class Hours:
         return self.value >= required
 
 
-@dataclass(frozen=True)
+Hours.ZERO = Hours.of(0)
+
+
+@final
+@dataclass(frozen=True, slots=True, order=True)
 class Progress:
     """진행도 값 객체 (0~100)"""
     
+    ZERO: ClassVar['Progress']  # 0% 진행도 공용 인스턴스 (클래스 정의 후 설정)
+    
     value: int
     
     def __post_init__(self):
         if not 0 <= self.value <= 100:
             raise ValueError(f"진행도는 0~100 사이여야 합니다: {self.value}")
     
+    @classmethod
+    @lru_cache(maxsize=256, typed=True)
+    def of(cls, value: int) -> 'Progress':
+        """같은 진행도는 같은 인스턴스를 재사용하는 팩토리 메서드 (0~100)"""
+        return cls(value)
+    
     def __add__(self, other: Union['Progress', int]) -> 'Progress':
         if isinstance(other, Progress):
-            return Progress(min(100, self.value + other.value))
-        return Progress(min(100, self.value + other))
+            return Progress.of(min(100, self.value + other.value))
+        return Progress.of(min(100, self.value + other))
     
     def is_complete(self) -> bool:
         """완료되었는지 확인"""
@@ -156,34 +243,45 @@ class Progress:
         return self.value / 100.0
 
 
-@dataclass(frozen=True)
+Progress.ZERO = Progress.of(0)
+
+
+@final
+@dataclass(frozen=True, slots=True)
 class Experience:
     """경험치 값 객체 (0~100, 100 도달 시 레벨업)"""
     
+    ZERO: ClassVar['Experience']  # 경험치 0 공용 인스턴스 (클래스 정의 후 설정)
+    
     value: int
     
     def __post_init__(self):
         if not 0 <= self.value <= 100:
             raise ValueError(f"경험치는 0~100 사이여야 합니다: {self.value}")
     
-    def __add__(self, other: Union['Experience', int]) -> tuple['Experience', int]:
+    @classmethod
+    @lru_cache(maxsize=128, typed=True)
+    def of(cls, value: int) -> 'Experience':
+        """같은 경험치는 같은 인스턴스를 재사용하는 팩토리 메서드 (0~100)"""
+        return cls(value)
+    
+    def add(self, other: Union['Experience', int]) -> tuple['Experience', int]:
         """경험치 추가 후 (새 경험치, 레벨업 횟수) 반환"""
-        if isinstance(other, Experience):
-            total = self.value + other.value
-        else:
-            total = self.value + other
-        
-        level_ups = total // 100
-        remaining_exp = total % 100
-        
-        return Experience(remaining_exp), level_ups
+        if other.__class__ is Experience:
+            other = other.value
+        level_ups, remaining_exp = divmod(self.value + other, 100)
+        return Experience.of(remaining_exp), level_ups
     
     def is_ready_for_levelup(self) -> bool:
         """레벨업 준비가 되었는지 확인"""
         return self.value >= 100
 
 
-@dataclass(frozen=True)
+Experience.ZERO = Experience.of(0)
+
+
+@final
+@dataclass(frozen=True, slots=True)
 class StatValue:
     """스탯 값 객체"""
     
@@ -200,6 +298,23 @@ class StatValue:
         new_base = max(0, self.base_value - penalty)
         return StatValue(base_value=new_base)
     
+    @staticmethod
+    def apply_fatigue_penalty_bulk(stats: Sequence['StatValue'], fatigue_levels: Sequence[int]) -> list['StatValue']:
+        """여러 스탯에 피로도 페널티를 한 번에 적용 (스탯별 apply_fatigue_penalty와 같은 결과)
+        
+        Args:
+            stats: 대상 스탯 목록
+            fatigue_levels: 스탯별 피로도 (stats와 같은 순서)
+        """
+        if len(stats) != len(fatigue_levels):
+            raise ValueError("피로도 개수가 스탯 수와 일치하지 않습니다")
+        
+        penalized = []
+        for stat, fatigue_level in zip(stats, fatigue_levels):
+            new_base = stat.base_value - fatigue_level // 10
+            penalized.append(StatValue(new_base if new_base > 0 else 0))
+        return penalized
+    
     def get_dice_bonus(self) -> int:
         """주사위 굴림 보너스 계산 (스탯 10당 +1)"""
         return self.base_value // 10
\ No newline at end of file
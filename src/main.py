@@ -70,15 +70,21 @@ def create_dependencies():
     return game_controller
 
 
+# 메인 메뉴 화면 (내용이 바뀌지 않으므로 한 번만 만들어 재사용)
+_MAIN_MENU_TEXT = "\n".join((
+    "\n===== 치킨마스터2 =====",
+    "1. 새 게임",
+    "2. 플레이어 상태 확인",
+    "3. 행동 실행",
+    "4. 불러오기 (미구현)",
+    "0. 종료",
+))
+
+
 def main_menu(game_controller: GameController):
     """메인 메뉴"""
     while True:
-        print("\n===== 치킨마스터2 =====")
-        print("1. 새 게임")
-        print("2. 플레이어 상태 확인")
-        print("3. 행동 실행")
-        print("4. 불러오기 (미구현)")
-        print("0. 종료")
+        print(_MAIN_MENU_TEXT)
         
         choice = input("선택: ").strip()
         
@@ -0,0 +1,27 @@
+"""
+테스트 공용 픽스처
+"""
+
+import pytest
+from uuid import uuid4
+
+from src.core.domain import Money, Percentage, StatValue, Player
+
+
+@pytest.fixture
+def player() -> Player:
+    """테스트용 플레이어 (체력 40, 피로도 10, 자금 100,000원)"""
+    return Player(
+        id=uuid4(),
+        name="테스트 플레이어",
+        cooking=StatValue(base_value=30),
+        management=StatValue(base_value=25),
+        service=StatValue(base_value=20),
+        tech=StatValue(base_value=15),
+        stamina=StatValue(base_value=40),
+        fatigue=Percentage(10),
+        happiness=Percentage(80),
+        money=Money(100000),
+        store_ids=(uuid4(),),
+        research_ids=(),
+    )
@@ -0,0 +1,302 @@
+"""
+도메인 엔티티 단위 테스트
+
+값 객체와 엔티티의 계산 결과, 복사 경로, 일괄 처리 함수를 테스트합니다.
+"""
+
+import dataclasses
+import pytest
+from uuid import uuid4
+
+from src.core.domain import (
+    Money, Percentage, StatValue,
+    Competitor, CompetitorStrategy, DelayedAction,
+    CustomerAI, CustomerPopulation, CustomerDemand, MarketAverages,
+    Product, Inventory, Progress,
+)
+from src.core.domain.competitor import collect_ready
+from src.core.domain.dataclass_utils import fast_replace
+from src.core.domain.product import apply_advertising_awareness
+
+
+def _make_product(awareness: int) -> Product:
+    """테스트용 제품 생성"""
+    ingredient = Inventory(id=uuid4(), name="닭", quantity=10, quality=70, purchase_price=Money(3000))
+    return Product(
+        id=uuid4(),
+        name="후라이드 치킨",
+        recipe_id=uuid4(),
+        selling_price=Money(18000),
+        research_progress=Progress(40),
+        ingredients=(ingredient,),
+        awareness=awareness,
+    )
+
+
+def _field_values(obj) -> tuple:
+    """init=False 캐시를 포함한 모든 필드 값"""
+    return tuple(getattr(obj, f.name) for f in dataclasses.fields(obj))
+
+
+class TestValueObjects:
+    """값 객체 테스트"""
+    
+    def test_money_of_reuses_instances_per_type(self):
+        """Money.of가 같은 금액은 재사용하고 int/float는 섞지 않는지 테스트"""
+        assert Money.of(5000) is Money.of(5000)
+        assert Money.of(5.0).amount.__class__ is float
+        assert Money.of(5).amount.__class__ is int
+        assert Money.of(5).format_korean() == Money(5).format_korean()
+    
+    def test_value_object_of_caches_keep_types_apart(self):
+        """값 객체 .of 캐시가 int/float 인자를 따로 저장하는지 테스트"""
+        assert Percentage.of(50.0).value.__class__ is float
+        assert Percentage.of(50).value.__class__ is int
+        assert Progress.of(30.0).value.__class__ is float
+        assert Progress.of(30).value.__class__ is int
+        assert Progress.of(30) is Progress.of(30)
+    
+    def test_percentage_mean(self):
+        """퍼센트 평균이 값 목록의 산술 평균과 같은지 테스트 (제너레이터 입력 포함)"""
+        values = [10, 25.5, 100, 0]
+        
+        assert Percentage.mean(values) == Percentage(sum(values) / len(values))
+        assert Percentage.mean(value for value in values) == Percentage.mean(values)
+        with pytest.raises(ValueError):
+            Percentage.mean([])
+    
+    def test_apply_fatigue_penalty_bulk_matches_scalar(self):
+        """스탯 일괄 피로도 페널티가 스탯별 apply_fatigue_penalty와 같은지 테스트 (0 하한 포함)"""
+        stats = [StatValue(base_value=value) for value in (0, 5, 30, 100)]
+        fatigue_levels = [50, 9, 120, 200]
+        
+        assert StatValue.apply_fatigue_penalty_bulk(stats, fatigue_levels) == [
+            stat.apply_fatigue_penalty(fatigue_level)
+            for stat, fatigue_level in zip(stats, fatigue_levels)
+        ]
+        with pytest.raises(ValueError):
+            StatValue.apply_fatigue_penalty_bulk(stats, fatigue_levels[:1])
+
+
+class TestPlayer:
+    """플레이어 엔티티 테스트"""
+    
+    def test_player_fatigue_level(self, player):
+        """피로도 단계 계산 테스트 (체력 40 대비 50%/90%/100%/200%)"""
+        player = player._replace(fatigue=Percentage(0))
+        
+        assert player.fatigue_level() == 0
+        assert player._replace(fatigue=Percentage(20)).fatigue_level() == 1
+        assert player._replace(fatigue=Percentage(36)).fatigue_level() == 2
+        assert player._replace(fatigue=Percentage(40)).is_knocked_out()
+        assert player._replace(fatigue=Percentage(80)).is_completely_exhausted()
+    
+    def test_state_changes_match_dataclasses_replace(self, player):
+        """상태 변경 복사 결과가 dataclasses.replace와 같은지 테스트"""
+        player.get_effective_stats()  # 캐시를 채워 두어도 복사본에는 넘어가지 않아야 함
+        
+        cases = (
+            (player.apply_fatigue(Percentage(5)), {'fatigue': Percentage(15)}),
+            (player.apply_fatigue_raw(200), {'fatigue': Percentage(100)}),
+            (player.apply_happiness(Percentage(10)), {'happiness': Percentage(90)}),
+            (player.spend_money(Money(1000)), {'money': Money(99000)}),
+            (player.earn_money(Money(1000)), {'money': Money(101000)}),
+        )
+        for copied, changes in cases:
+            expected = dataclasses.replace(player, **changes)
+            assert _field_values(copied) == _field_values(expected)
+            assert copied._effective_stats is None
+        
+        assert _field_values(fast_replace(player, {'money': Money(5)})) == _field_values(
+            dataclasses.replace(player, money=Money(5))
+        )
+
+
+class TestCompetitor:
+    """경쟁자 엔티티 테스트"""
+    
+    def test_delayed_actions_ordered_by_target_turn(self):
+        """지연 행동 큐 정렬 및 실행 테스트"""
+        late = DelayedAction(id=uuid4(), action_type="marketing", target_turn=7, parameters={})
+        early = DelayedAction(id=uuid4(), action_type="price_change", target_turn=2, parameters={})
+        
+        competitor = Competitor(
+            id=uuid4(),
+            name="라이벌 치킨집",
+            strategy=CompetitorStrategy.DEFENSIVE,
+            money=Money(50000),
+            store_ids=(uuid4(),),
+            delayed_actions=(late,),
+        ).add_delayed_action(early)
+        
+        assert competitor.delayed_actions == (early, late)
+        assert competitor.get_ready_actions(5) == [early]
+        
+        # 실행된 행동만 큐에서 제거
+        remaining = competitor.execute_ready_actions(5)
+        assert remaining.delayed_actions == (late,)
+        assert remaining.execute_ready_actions(5) is remaining
+    
+    def test_unsorted_delayed_actions_sorted_on_construction(self):
+        """생성자에 정렬되지 않은 지연 행동을 넘겨도 실행 턴 순으로 처리하는지 테스트"""
+        late = DelayedAction(id=uuid4(), action_type="marketing", target_turn=7, parameters={})
+        early = DelayedAction(id=uuid4(), action_type="price_change", target_turn=2, parameters={})
+        
+        competitor = Competitor(
+            id=uuid4(),
+            name="라이벌 치킨집",
+            strategy=CompetitorStrategy.DEFENSIVE,
+            money=Money(50000),
+            store_ids=(uuid4(),),
+            delayed_actions=(late, early),
+        )
+        
+        assert competitor.delayed_actions == (early, late)
+        assert competitor.get_ready_actions(5) == [early]
+        assert competitor.execute_ready_actions(5).delayed_actions == (late,)
+        assert collect_ready([competitor], 5) == {competitor.id: [early]}
+    
+    def test_collect_ready_matches_get_ready_actions(self):
+        """여러 경쟁자 일괄 수집이 경쟁자별 get_ready_actions와 같은지 테스트"""
+        def action(target_turn):
+            return DelayedAction(id=uuid4(), action_type="marketing", target_turn=target_turn, parameters={})
+        
+        competitors = [
+            Competitor(
+                id=uuid4(),
+                name=f"라이벌 {index}",
+                strategy=CompetitorStrategy.AGGRESSIVE,
+                money=Money(50000),
+                store_ids=(uuid4(),),
+                delayed_actions=actions,
+            )
+            for index, actions in enumerate((
+                (action(1), action(3), action(3), action(9)),
+                (action(6),),
+                (),
+                (action(5), action(2)),
+            ))
+        ]
+        
+        for current_turn in (0, 3, 5, 10):
+            expected = {
+                competitor.id: competitor.get_ready_actions(current_turn)
+                for competitor in competitors
+                if competitor.get_ready_actions(current_turn)
+            }
+            assert collect_ready(competitors, current_turn) == expected
+    
+    def test_earn_money_matches_dataclasses_replace(self):
+        """자금 변경 복사가 dataclasses.replace와 같은지 테스트 (init=False 필드 포함)"""
+        competitor = Competitor(
+            id=uuid4(),
+            name="라이벌 치킨집",
+            strategy=CompetitorStrategy.AGGRESSIVE,
+            money=Money(50000),
+            store_ids=(uuid4(),),
+            delayed_actions=(),
+        )
+        
+        earned = competitor.earn_money(Money(1000))
+        expected = dataclasses.replace(competitor, money=Money(51000))
+        assert _field_values(earned) == _field_values(expected)
+
+
+class TestProduct:
+    """제품 엔티티 테스트"""
+    
+    def test_apply_daily_awareness_matches_step_by_step(self):
+        """하루치 인지도 일괄 적용이 판매 증가 후 일일 감소와 같은지 테스트 (0 하한 포함)"""
+        for awareness in (0, 1, 25):
+            product = _make_product(awareness)
+            for sales_count in (0, 1, 4):
+                expected = product
+                for _ in range(sales_count):
+                    expected = expected.increase_awareness_by_sale()
+                expected = expected.decrease_awareness_daily()
+                assert _field_values(product.apply_daily_awareness(sales_count)) == _field_values(expected)
+
+    
+    def test_apply_advertising_awareness_matches_per_product(self):
+        """여러 제품 광고 인지도 일괄 적용이 제품별 적용과 같은지 테스트"""
+        products = [_make_product(awareness) for awareness in (0, 10, 50)]
+        my_ad_costs = [Money(5000), Money(30000), Money(80000)]
+        competitor_max_ad_cost = Money(30000)
+        
+        updated = apply_advertising_awareness(products, my_ad_costs, competitor_max_ad_cost)
+        
+        assert [_field_values(product) for product in updated] == [
+            _field_values(product.increase_awareness_by_advertising(my_ad_cost, competitor_max_ad_cost))
+            for product, my_ad_cost in zip(products, my_ad_costs)
+        ]
+        with pytest.raises(ValueError):
+            apply_advertising_awareness(products, my_ad_costs[:2], competitor_max_ad_cost)
+
+
+class TestCustomerPopulation:
+    """고객 집단 테스트"""
+    
+    def test_population_matches_customer_ai(self):
+        """배열에 저장한 고객과 점수가 CustomerAI와 정확히 같은지 테스트"""
+        customers = [
+            CustomerAI(
+                id=uuid4(),
+                name=f"고객{index}",
+                price_sensitivity=price_sensitivity,
+                quality_preference=0.3,
+                brand_loyalty=0.1,
+                desire=Percentage(33.3),
+            )
+            for index, price_sensitivity in enumerate((0.7, 0.45, 0.1))
+        ]
+        population = CustomerPopulation(customers)
+        market_averages = MarketAverages(
+            average_price=Money(20000), average_quality=60.0, average_awareness=40.0
+        )
+        
+        assert [population.get_customer(i) for i in range(len(population))] == customers
+        assert list(population.evaluate_product(Money(17000), 70, 30, market_averages)) == [
+            customer.evaluate_product(Money(17000), 70, 30, market_averages)
+            for customer in customers
+        ]
+    
+    def test_evaluate_products_matches_evaluate_product(self):
+        """여러 제품 일괄 평가가 제품별 평가와 같은지 테스트 (평균 0 항목 포함)"""
+        customer = CustomerAI(
+            id=uuid4(),
+            name="고객",
+            price_sensitivity=0.6,
+            quality_preference=0.25,
+            brand_loyalty=0.4,
+            desire=Percentage(10),
+        )
+        offers = [(Money(15000), 80, 20), (Money(30000), 40, 90), (Money(0), 0, 0)]
+        
+        for market_averages in (
+            MarketAverages(average_price=Money(20000), average_quality=60.0, average_awareness=40.0),
+            MarketAverages(average_price=Money(0), average_quality=0.0, average_awareness=0.0),
+        ):
+            assert customer.evaluate_products(offers, market_averages) == [
+                customer.evaluate_product(price, quality, awareness, market_averages)
+                for price, quality, awareness in offers
+            ]
+
+
+class TestCustomerDemand:
+    """고객 수요 테스트"""
+    
+    def test_create_reuses_validated_instances(self):
+        """create가 생성자와 같은 값을 주고 같은 입력에는 같은 객체를 재사용하는지 테스트"""
+        demand = CustomerDemand.create(1000, 100, 900)
+        
+        assert demand == CustomerDemand(1000, 100, 900)
+        assert CustomerDemand.create(1000, 100, 900) is demand
+        with pytest.raises(ValueError):
+            CustomerDemand.create(1000, 300, 700)
+    
+    def test_zero_customers(self):
+        """고객이 없는 수요는 비율 검사 없이 생성되는지 테스트"""
+        demand = CustomerDemand.create(0, 0, 0)
+        
+        assert demand.get_ai_customer_ratio() == 0.0
+        assert demand.calculate_numerical_demand(Percentage(50)) == 0
@@ -0,0 +1,101 @@
+"""
+게임 루프 서비스 단위 테스트
+
+페이즈 진행과 턴 단위 저장(dirty 표시 후 flush)을 테스트합니다.
+"""
+
+from datetime import date
+
+from src.application.game_loop_service import GameLoopService
+from src.core.domain import GamePhase
+
+
+class FakeRepository:
+    """저장 호출만 기록하는 테스트용 저장소"""
+    
+    def __init__(self):
+        self.saved_players = []
+        self.saved_turns = []
+    
+    def save_player(self, player):
+        self.saved_players.append(player)
+    
+    def save_turn(self, turn):
+        self.saved_turns.append(turn)
+
+
+def _start_game(player, **options):
+    """새 게임을 시작하고 시작 시 저장 기록은 비운 (서비스, 저장소) 반환"""
+    repository = FakeRepository()
+    service = GameLoopService(repository, verbose=False, **options)
+    service.start_new_game(player, date(2024, 1, 1))
+    repository.saved_turns.clear()
+    return service, repository
+
+
+class TestGameLoopSaving:
+    """턴 저장 시점 테스트"""
+    
+    def test_one_save_per_completed_turn(self, player):
+        """턴을 완료할 때마다 정확히 한 번 저장하는지 테스트"""
+        service, repository = _start_game(player)
+        
+        service.play_turn()
+        service.play_turn()
+        
+        assert [turn.turn_number for turn in repository.saved_turns] == [2, 3]
+        assert all(turn.current_phase == GamePhase.PLAYER_ACTION for turn in repository.saved_turns)
+        
+        # advance_phase로 한 턴을 진행해도 저장은 한 번
+        for _ in GamePhase:
+            service.advance_phase()
+        assert [turn.turn_number for turn in repository.saved_turns] == [2, 3, 4]
+        assert service.flush() is False
+    
+    def test_flush_persists_partial_turn(self, player):
+        """턴 중간 진행 상태는 저장하지 않다가 flush에서 저장하는지 테스트"""
+        service, repository = _start_game(player)
+        
+        for _ in range(3):
+            service.advance_phase()
+        assert repository.saved_turns == []
+        
+        assert service.flush() is True
+        assert len(repository.saved_turns) == 1
+        saved = repository.saved_turns[0]
+        assert saved.turn_number == 1
+        assert saved.current_phase == GamePhase.SALES
+        
+        # 저장할 변경이 없으면 다시 저장하지 않음
+        assert service.flush() is False
+        assert len(repository.saved_turns) == 1
+    
+    def test_save_every_phase(self, player):
+        """save_every_phase 옵션에서는 페이즈마다 저장하는지 테스트"""
+        service, repository = _start_game(player, save_every_phase=True)
+        
+        service.play_turn()
+        
+        assert [turn.current_phase for turn in repository.saved_turns] == [
+            GamePhase.AI_ACTION,
+            GamePhase.EVENT,
+            GamePhase.SALES,
+            GamePhase.SETTLEMENT,
+            GamePhase.CLEANUP,
+            GamePhase.PLAYER_ACTION,
+        ]
+        assert repository.saved_turns[-1].turn_number == 2
+    
+    def test_new_game_flushes_previous_partial_turn(self, player):
+        """새 게임을 시작하기 전에 이전 게임의 미저장 진행 상태를 저장하는지 테스트"""
+        service, repository = _start_game(player)
+        service.advance_phase()
+        
+        service.start_new_game(player, date(2024, 2, 1))
+        
+        assert [(turn.turn_number, turn.current_phase) for turn in repository.saved_turns] == [
+            (1, GamePhase.AI_ACTION),
+            (1, GamePhase.PLAYER_ACTION),
+        ]
+        assert repository.saved_turns[1].game_date == date(2024, 2, 1)
+        assert service.flush() is False